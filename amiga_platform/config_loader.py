@@ -5,8 +5,9 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel
+
+from amiga_platform.core.config import _yaml_load
 
 logger = logging.getLogger(__name__)
 
@@ -67,11 +68,6 @@ class CameraConfig(BaseModel):
     offset_z: float
     pitch_deg: float = 0.0  # Camera tilt angle
 
-    class Config:
-        """Pydantic config."""
-
-        arbitrary_types_allowed = True
-
 
 class VisionConfig(BaseModel):
     """Vision system configuration."""
@@ -118,7 +114,7 @@ class PlatformConfig(BaseModel):
         """
         logger.info(f"Loading platform config from {path}")
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = _yaml_load(f)
         return cls(**data)
 
 
@@ -131,11 +127,6 @@ class BlastPatternConfig(BaseModel):
     turn_direction: str = "left"
     row_spacing_m: float = 6.0
 
-    class Config:
-        """Pydantic config."""
-
-        arbitrary_types_allowed = True
-
 
 class MissionConfig(BaseModel):
     """Mission-specific configuration."""
@@ -156,7 +147,7 @@ class MissionConfig(BaseModel):
         """
         logger.info(f"Loading mission config from {path}")
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = _yaml_load(f)
         return cls(**data)
 
 
@@ -179,7 +170,7 @@ class ModuleConfig(BaseModel):
         """
         logger.info(f"Loading module config from {path}")
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = _yaml_load(f)
         return cls(**data)
 
 
@@ -9,6 +9,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 from farm_ng_core_pybind import Pose3F64
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,13 @@ class HoleStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Compact status codes for the per-pattern status array (index into _STATUSES)
+_STATUSES = tuple(HoleStatus)
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+_PENDING = _STATUS_CODE[HoleStatus.PENDING]
+_IN_PROGRESS = _STATUS_CODE[HoleStatus.IN_PROGRESS]
+
+
 @dataclass
 class HoleRecord:
     """Record for a single hole in the blast pattern.
@@ -90,6 +98,10 @@ class BlastPattern:
     - State persistence for mission resume
 
     Separate from PathPlanner to decouple mission state from navigation.
+
+    Hole statuses are mirrored in a uint8 array so per-iteration queries
+    (next hole, stats, completion) are vectorized instead of walking records.
+    Always change status through the mark_* methods to keep both in sync.
     """
 
     def __init__(
@@ -112,6 +124,7 @@ class BlastPattern:
         self.holes: List[HoleRecord] = [
             HoleRecord(index=i, position=pose) for i, pose in enumerate(holes)
         ]
+        self._status = np.full(len(self.holes), _PENDING, dtype=np.uint8)
 
         self.current_hole_index: Optional[int] = None
 
@@ -126,10 +139,11 @@ class BlastPattern:
         Returns:
             Next hole with PENDING status, or None if all done
         """
-        for hole in self.holes:
-            if hole.status == HoleStatus.PENDING:
-                return hole
-        return None
+        pending = self._status == _PENDING
+        if not pending.size:
+            return None
+        idx = int(pending.argmax())
+        return self.holes[idx] if pending[idx] else None
 
     def get_hole(self, index: int) -> Optional[HoleRecord]:
         """Get hole by index.
@@ -144,6 +158,19 @@ class BlastPattern:
             return self.holes[index]
         return None
 
+    def _set_status(self, hole: HoleRecord, status: HoleStatus) -> None:
+        """Set hole status on the record and in the status array."""
+        hole.status = status
+        self._status[hole.index] = _STATUS_CODE[status]
+
+    def _rebuild_status(self) -> None:
+        """Rebuild the status array from the hole records."""
+        self._status = np.fromiter(
+            (_STATUS_CODE[hole.status] for hole in self.holes),
+            dtype=np.uint8,
+            count=len(self.holes),
+        )
+
     def mark_in_progress(self, index: int) -> None:
         """Mark hole as in progress.
 
@@ -152,7 +179,7 @@ class BlastPattern:
         """
         hole = self.get_hole(index)
         if hole:
-            hole.status = HoleStatus.IN_PROGRESS
+            self._set_status(hole, HoleStatus.IN_PROGRESS)
             hole.attempts += 1
             self.current_hole_index = index
             logger.info(f"Hole {index} marked IN_PROGRESS (attempt {hole.attempts})")
@@ -168,7 +195,7 @@ class BlastPattern:
         """
         hole = self.get_hole(index)
         if hole:
-            hole.status = HoleStatus.COMPLETED
+            self._set_status(hole, HoleStatus.COMPLETED)
             hole.timestamp_completed = datetime.now().isoformat()
             if measurements:
                 hole.measurements = measurements
@@ -183,7 +210,7 @@ class BlastPattern:
         """
         hole = self.get_hole(index)
         if hole:
-            hole.status = HoleStatus.FAILED
+            self._set_status(hole, HoleStatus.FAILED)
             hole.last_error = error
             logger.error(f"✗ Hole {index} marked FAILED: {error}")
 
@@ -196,7 +223,7 @@ class BlastPattern:
         """
         hole = self.get_hole(index)
         if hole:
-            hole.status = HoleStatus.SKIPPED
+            self._set_status(hole, HoleStatus.SKIPPED)
             hole.last_error = reason
             logger.warning(f"⊘ Hole {index} marked SKIPPED: {reason}")
 
@@ -206,11 +233,8 @@ class BlastPattern:
         Returns:
             True if no holes are pending or in progress
         """
-        return all(
-            hole.status
-            in [HoleStatus.COMPLETED, HoleStatus.FAILED, HoleStatus.SKIPPED]
-            for hole in self.holes
-        )
+        # PENDING and IN_PROGRESS are the two lowest codes
+        return not bool((self._status <= _IN_PROGRESS).any())
 
     def is_echelon_end(self, index: int) -> bool:
         """Check if hole index is at the end of an echelon/row.
@@ -233,17 +257,10 @@ class BlastPattern:
         Returns:
             Dictionary with counts for each status
         """
-        stats = {
-            "total": len(self.holes),
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "failed": 0,
-            "skipped": 0,
-        }
-
-        for hole in self.holes:
-            stats[hole.status.value] += 1
+        counts = np.bincount(self._status, minlength=len(_STATUSES))
+        stats = {"total": len(self.holes)}
+        for status, count in zip(_STATUSES, counts.tolist()):
+            stats[status.value] = count
 
         return stats
 
@@ -305,6 +322,7 @@ class BlastPattern:
 
         # Restore hole records with their states
         pattern.holes = holes
+        pattern._rebuild_status()
         pattern.current_hole_index = state.get("current_hole_index")
 
         logger.info(f"Blast pattern state loaded from {path}")
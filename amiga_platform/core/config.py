@@ -1,21 +1,110 @@
-"""Configuration system using Pydantic for validation and type safety.
+"""Configuration system using frozen dataclasses for validation and type safety.
 
 This module maintains backward compatibility with the v1 config system
 while also supporting the new multi-tier platform/mission/module configs.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, Literal, Optional
+from types import MappingProxyType
+from typing import Any, Literal, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
 
-class ServiceConfig(BaseModel):
+def _yaml_load(stream: Any) -> Any:
+    """Parse YAML with the libyaml C loader when PyYAML was built with it.
+
+    Args:
+        stream: YAML text, bytes, or an open file
+
+    Returns:
+        Parsed document
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+# Converters for scalar field annotations (annotations are strings under
+# `from __future__ import annotations`)
+_COERCE = {"str": str, "int": int, "float": float, "bool": bool, "Path": Path}
+
+
+# Parsed v1 configs keyed by (path, content digest); configs are frozen so sharing is safe
+_CONFIG_CACHE: dict[tuple[str, bytes], XStemConfig] = {}
+
+
+def _build(cls: type, data: dict) -> Any:
+    """Construct a config dataclass from a mapping with scalar coercion.
+
+    Unknown keys are ignored; missing required keys raise TypeError from
+    the dataclass constructor.
+
+    Args:
+        cls: Config dataclass to construct
+        data: Raw mapping (e.g., parsed YAML section)
+
+    Returns:
+        Instance of cls
+    """
+    kwargs = {}
+    for f in fields(cls):
+        if not f.init or f.name not in data:
+            continue
+        value = data[f.name]
+        type_name = f.type.removesuffix(" | None")
+        if type_name.startswith("Optional["):
+            type_name = type_name[len("Optional["):-1]
+        convert = _COERCE.get(type_name)
+        kwargs[f.name] = convert(value) if convert is not None and value is not None else value
+    return cls(**kwargs)
+
+
+def _check_choice(name: str, value: str, choices: tuple[str, ...]) -> None:
+    """Validate a Literal-typed field.
+
+    Raises:
+        ValueError: If value is not one of choices
+    """
+    if value not in choices:
+        raise ValueError(f"{name} must be one of {choices}, got {value!r}")
+
+
+class _ConfigBase:
+    """Shared helpers for config dataclasses."""
+
+    __slots__ = ()
+
+    def dict(self) -> dict:
+        """Convert to a plain dictionary (nested configs included).
+
+        Derived fields (field(init=False)) are left out, so the result can be
+        passed back to the constructor.
+        """
+        return {f.name: _plain(getattr(self, f.name)) for f in fields(self) if f.init}
+
+
+def _plain(value: Any) -> Any:
+    """Convert nested configs (and mappings of them) for _ConfigBase.dict()."""
+    if isinstance(value, _ConfigBase):
+        return value.dict()
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ServiceConfig(_ConfigBase):
     """EventService connection details."""
 
     name: str
@@ -23,7 +112,8 @@ class ServiceConfig(BaseModel):
     port: int
 
 
-class WaypointConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class WaypointConfig(_ConfigBase):
     """Waypoint loading configuration."""
 
     csv_path: Path
@@ -33,13 +123,14 @@ class WaypointConfig(BaseModel):
     row_spacing_m: float = 6.0
     headland_buffer_m: float = 2.0
 
-    class Config:
-        """Pydantic config."""
+    def __post_init__(self) -> None:
+        """Validate literal fields."""
+        _check_choice("coordinate_system", self.coordinate_system, ("ENU", "NWU"))
+        _check_choice("turn_direction", self.turn_direction, ("left", "right"))
 
-        arbitrary_types_allowed = True
 
-
-class ToolConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ToolConfig(_ConfigBase):
     """Tool/implement configuration."""
 
     type: str = "stemming"
@@ -58,7 +149,8 @@ class ToolConfig(BaseModel):
     chute_rate_hz: float = 10.0
 
 
-class CameraConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CameraConfig(_ConfigBase):
     """Camera configuration."""
 
     service_name: str  # "oak/0" or "oak/1"
@@ -69,13 +161,13 @@ class CameraConfig(BaseModel):
     offset_z: float
     pitch_deg: float = 0.0  # Camera tilt angle
 
-    class Config:
-        """Pydantic config."""
-
-        arbitrary_types_allowed = True
+    def __post_init__(self) -> None:
+        """Validate literal fields."""
+        _check_choice("role", self.role, ("forward", "downward"))
 
 
-class VisionConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class VisionConfig(_ConfigBase):
     """Vision system configuration."""
 
     enabled: bool = True
@@ -86,8 +178,21 @@ class VisionConfig(BaseModel):
     forward_camera: CameraConfig
     downward_camera: CameraConfig
 
+    def __post_init__(self) -> None:
+        """Validate literal fields."""
+        _check_choice("mode", self.mode, ("stop_to_detect", "detect_on_fly"))
 
-class NavigationConfig(BaseModel):
+    @classmethod
+    def from_dict(cls, data: dict) -> VisionConfig:
+        """Build from a raw mapping, including nested camera configs."""
+        data = dict(data)
+        data["forward_camera"] = _build(CameraConfig, data["forward_camera"])
+        data["downward_camera"] = _build(CameraConfig, data["downward_camera"])
+        return _build(cls, data)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NavigationConfig(_ConfigBase):
     """Navigation behavior configuration."""
 
     approach_offset_m: float = 1.2
@@ -96,7 +201,8 @@ class NavigationConfig(BaseModel):
     can_recovery_delay_s: float = 0.5
 
 
-class ThresholdsConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ThresholdsConfig(_ConfigBase):
     """Detection and control thresholds."""
 
     positioning_accuracy_m: float = 0.05
@@ -104,16 +210,40 @@ class ThresholdsConfig(BaseModel):
     alignment_tolerance_m: float = 0.02
 
 
-class XStemConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class XStemConfig(_ConfigBase):
     """Master configuration (v1 - backward compatible)."""
 
-    services: Dict[str, ServiceConfig]
+    services: Mapping[str, ServiceConfig]
     waypoints: WaypointConfig
     tool: ToolConfig
     vision: VisionConfig
     navigation: NavigationConfig
     thresholds: ThresholdsConfig
 
+    def __post_init__(self) -> None:
+        """Make services read-only, since from_yaml() shares instances."""
+        object.__setattr__(self, "services", MappingProxyType(dict(self.services)))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> XStemConfig:
+        """Build from a raw mapping (v1 layout).
+
+        Args:
+            data: Parsed v1 config mapping
+
+        Returns:
+            Validated configuration
+        """
+        return cls(
+            services={name: _build(ServiceConfig, svc) for name, svc in data["services"].items()},
+            waypoints=_build(WaypointConfig, data["waypoints"]),
+            tool=_build(ToolConfig, data["tool"]),
+            vision=VisionConfig.from_dict(data["vision"]),
+            navigation=_build(NavigationConfig, data["navigation"]),
+            thresholds=_build(ThresholdsConfig, data["thresholds"]),
+        )
+
     @classmethod
     def from_yaml(cls, path: Path) -> XStemConfig:
         """Load configuration from YAML file (v1 format).
@@ -122,12 +252,18 @@ class XStemConfig(BaseModel):
             path: Path to v1-style navigation_config.yaml
 
         Returns:
-            Validated configuration
+            Validated configuration (shared instance if the file is unchanged)
         """
+        raw = Path(path).read_bytes()
+        key = (str(path), hashlib.blake2b(raw, digest_size=16).digest())
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         logger.info(f"Loading v1 config from {path}")
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+        config = cls.from_dict(_yaml_load(raw))
+        _CONFIG_CACHE[key] = config
+        return config
 
     @classmethod
     def from_multi_tier(
@@ -159,7 +295,7 @@ class XStemConfig(BaseModel):
         module = loader.get_module_config()
 
         # Map v2 config to v1 structure
-        services = {name: ServiceConfig(**svc.dict()) for name, svc in platform.services.items()}
+        services = {name: _build(ServiceConfig, svc.model_dump()) for name, svc in platform.services.items()}
 
         waypoints = WaypointConfig(
             csv_path=mission.blast_pattern.csv_path,
@@ -1,36 +1,46 @@
 """Multi-service client management for EventService connections."""
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from farm_ng.core.event_client import EventClient
 from farm_ng.core.event_service_pb2 import EventServiceConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from .config import ServiceConfig
 
+# Services every mission needs; checked once at construction
+REQUIRED_SERVICES = ("filter", "track_follower", "canbus")
+
 
 class ServiceManager:
-    """Manages EventClient instances for multiple services."""
+    """Manages EventClient instances for multiple services.
 
-    def __init__(self, service_configs: dict[str, ServiceConfig]) -> None:
-        """Initialize service clients from configuration.
+    Clients are created lazily on first use, so services a run never
+    touches (e.g. cameras with vision disabled) are never connected.
+    """
+
+    def __init__(self, service_configs: Mapping[str, ServiceConfig]) -> None:
+        """Store service configurations.
 
         Args:
             service_configs: Dictionary mapping service names to their configurations
+
+        Raises:
+            KeyError: If a required service is not configured
         """
-        self.clients: dict[str, EventClient] = {}
+        missing = [name for name in REQUIRED_SERVICES if name not in service_configs]
+        if missing:
+            raise KeyError(f"Required service(s) not configured: {', '.join(missing)}")
 
-        for name, config in service_configs.items():
-            event_config = EventServiceConfig(
-                name=config.name,
-                host=config.host,
-                port=config.port,
-            )
-            self.clients[name] = EventClient(event_config)
+        self._configs = service_configs
+        self._clients: dict[str, EventClient] = {}
 
     def get(self, name: str) -> EventClient:
-        """Get client by name with validation.
+        """Get client by name, creating it on first use.
 
         Args:
             name: Service name to retrieve
@@ -41,31 +51,39 @@ class ServiceManager:
         Raises:
             KeyError: If service name is not configured
         """
-        if name not in self.clients:
-            raise KeyError(f"Service '{name}' not configured")
-        return self.clients[name]
+        client = self._clients.get(name)
+        if client is None:
+            if name not in self._configs:
+                raise KeyError(f"Service '{name}' not configured")
+            config = self._configs[name]
+            client = self._clients[name] = EventClient(
+                EventServiceConfig(name=config.name, host=config.host, port=config.port)
+            )
+        return client
+
+    # Named accessors resolve once, then read straight from the instance dict
 
-    @property
+    @cached_property
     def filter(self) -> EventClient:
         """Get the filter service client."""
         return self.get("filter")
 
-    @property
+    @cached_property
     def track_follower(self) -> EventClient:
         """Get the track follower service client."""
         return self.get("track_follower")
 
-    @property
+    @cached_property
     def canbus(self) -> EventClient:
         """Get the CAN bus service client."""
         return self.get("canbus")
 
-    @property
-    def oak0(self) -> EventClient:
-        """Get the downward camera (oak/0) service client."""
-        return self.get("oak0")
+    @cached_property
+    def oak0(self) -> EventClient | None:
+        """Get the downward camera (oak/0) service client, or None if not configured."""
+        return self.get("oak0") if "oak0" in self._configs else None
 
-    @property
-    def oak1(self) -> EventClient:
-        """Get the forward camera (oak/1) service client."""
-        return self.get("oak1")
+    @cached_property
+    def oak1(self) -> EventClient | None:
+        """Get the forward camera (oak/1) service client, or None if not configured."""
+        return self.get("oak1") if "oak1" in self._configs else None
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import ClassVar
 
 logger = logging.getLogger(__name__)
 
@@ -54,13 +55,148 @@ class NavState(str, Enum):
     EMERGENCY_STOP = "emergency_stop"  # E-stop triggered
 
 
+class NavEvent(IntEnum):
+    """Navigation events that drive state transitions (see NavigationStateMachine.fire)."""
+
+    # Initialization
+    START = 0
+    INITIALIZE = 1
+    INITIALIZATION_COMPLETE = 2
+
+    # Per-hole navigation cycle
+    GOAL_SET = 3
+    PATH_PLOTTED = 4
+    APPROACHING_STOP = 5
+    STOPPED = 6
+    HOLE_DETECTED = 7
+    HOLE_NOT_FOUND = 8
+    COORDINATES_CONVERTED = 9
+
+    # Module execution
+    READY_FOR_MODULE = 10
+    MODULE_COMPLETE = 11
+
+    # Pattern update outcomes
+    PATTERN_COMPLETE = 12
+    PATTERN_ECHELON_END = 13
+    PATTERN_UPDATED = 14
+    ECHELON_TURN_COMPLETE = 15
+
+    # Error handling
+    SEGMENT_TIMEOUT = 16
+    ENTER_RECOVERY = 17
+    RETRY = 18
+    SKIP_HOLE = 19
+    ABORT = 20
+    EMERGENCY_STOP = 21
+
+    # Mission completion
+    START_RETURN = 22
+    MISSION_COMPLETE = 23
+    SHUTDOWN = 24
+
+
+# Target state for each event (flowchart-aligned)
+_EVENT_TARGETS: dict[NavEvent, NavState] = {
+    NavEvent.START: NavState.PLANNING,
+    NavEvent.INITIALIZE: NavState.INITIALIZING,
+    NavEvent.INITIALIZATION_COMPLETE: NavState.PLANNING,
+    NavEvent.GOAL_SET: NavState.PLOTTING_PATH,
+    NavEvent.PATH_PLOTTED: NavState.FOLLOWING_PATH,
+    NavEvent.APPROACHING_STOP: NavState.STOPPING,
+    NavEvent.STOPPED: NavState.DETECTING,
+    NavEvent.HOLE_DETECTED: NavState.CONVERTING,
+    NavEvent.HOLE_NOT_FOUND: NavState.PLOTTING_PATH,  # Use CSV position, skip CONVERTING
+    NavEvent.COORDINATES_CONVERTED: NavState.PLOTTING_PATH,
+    NavEvent.READY_FOR_MODULE: NavState.MODULE_PHASE,
+    NavEvent.MODULE_COMPLETE: NavState.UPDATING_PATTERN,
+    NavEvent.PATTERN_COMPLETE: NavState.RETURNING,
+    NavEvent.PATTERN_ECHELON_END: NavState.ECHELON_TURN,
+    NavEvent.PATTERN_UPDATED: NavState.PLANNING,
+    NavEvent.ECHELON_TURN_COMPLETE: NavState.PLANNING,
+    NavEvent.SEGMENT_TIMEOUT: NavState.SEGMENT_TIMEOUT,
+    NavEvent.ENTER_RECOVERY: NavState.RECOVERING,
+    NavEvent.RETRY: NavState.PLANNING,
+    NavEvent.SKIP_HOLE: NavState.PLANNING,
+    NavEvent.ABORT: NavState.FAILED,
+    NavEvent.EMERGENCY_STOP: NavState.EMERGENCY_STOP,
+    NavEvent.START_RETURN: NavState.RETURNING,
+    NavEvent.MISSION_COMPLETE: NavState.COMPLETE,
+    NavEvent.SHUTDOWN: NavState.COMPLETE,
+}
+
+
 class NavigationStateMachine:
-    """Simple state machine for navigation control."""
+    """Simple state machine for navigation control.
 
-    def __init__(self) -> None:
-        """Initialize state machine."""
+    Transitions are table-driven: fire(event) looks up the next state in a
+    flat (state, event) table. The named methods below are thin wrappers
+    kept for readability and backward compatibility.
+    """
+
+    # Allowed edges: flowchart transitions plus the shortcuts taken by the
+    # legacy methods (e.g. STOPPING → CONVERTING when detection runs inline).
+    # Every state may additionally go to _ALWAYS_ALLOWED.
+    _ALLOWED: ClassVar[dict[NavState, frozenset[NavState]]] = {
+        NavState.IDLE: frozenset({NavState.INITIALIZING, NavState.PLANNING}),
+        NavState.INITIALIZING: frozenset({NavState.PLANNING}),
+        NavState.PLANNING: frozenset({NavState.PLOTTING_PATH}),
+        NavState.PLOTTING_PATH: frozenset(
+            {NavState.FOLLOWING_PATH, NavState.STOPPING, NavState.RECOVERING}
+        ),
+        NavState.FOLLOWING_PATH: frozenset(
+            {
+                NavState.STOPPING,
+                NavState.MODULE_PHASE,
+                NavState.SEGMENT_TIMEOUT,
+                NavState.RECOVERING,
+            }
+        ),
+        NavState.STOPPING: frozenset(
+            {
+                NavState.DETECTING,
+                NavState.CONVERTING,
+                NavState.PLOTTING_PATH,
+                NavState.RECOVERING,
+            }
+        ),
+        NavState.DETECTING: frozenset(
+            {NavState.CONVERTING, NavState.PLOTTING_PATH, NavState.RECOVERING}
+        ),
+        NavState.CONVERTING: frozenset(
+            {NavState.PLOTTING_PATH, NavState.FOLLOWING_PATH, NavState.RECOVERING}
+        ),
+        NavState.MODULE_PHASE: frozenset({NavState.UPDATING_PATTERN, NavState.RECOVERING}),
+        NavState.UPDATING_PATTERN: frozenset(
+            {
+                NavState.PLANNING,
+                NavState.PLOTTING_PATH,
+                NavState.ECHELON_TURN,
+                NavState.RETURNING,
+            }
+        ),
+        NavState.ECHELON_TURN: frozenset({NavState.PLANNING, NavState.RECOVERING}),
+        NavState.RETURNING: frozenset({NavState.RECOVERING}),
+        NavState.SEGMENT_TIMEOUT: frozenset({NavState.RECOVERING}),
+        NavState.RECOVERING: frozenset({NavState.PLANNING, NavState.PLOTTING_PATH}),
+        NavState.COMPLETE: frozenset(),
+        NavState.FAILED: frozenset(),
+        NavState.EMERGENCY_STOP: frozenset(),
+    }
+    _ALWAYS_ALLOWED: ClassVar[frozenset[NavState]] = frozenset(
+        {NavState.COMPLETE, NavState.FAILED, NavState.EMERGENCY_STOP}
+    )
+
+    def __init__(self, strict: bool = False) -> None:
+        """Initialize state machine.
+
+        Args:
+            strict: Raise on illegal transitions instead of logging and
+                rejecting them (for tests)
+        """
         self._current_state = NavState.IDLE
         self._previous_state = NavState.IDLE
+        self._strict = strict
 
     @property
     def current_state(self) -> NavState:
@@ -72,16 +208,54 @@ class NavigationStateMachine:
         """Get previous state."""
         return self._previous_state
 
-    def transition(self, new_state: NavState) -> None:
+    def transition(self, new_state: NavState) -> bool:
         """Transition to a new state with logging.
 
         Args:
             new_state: Target state to transition to
+
+        Returns:
+            False if the edge is not allowed and the state was left unchanged
+
+        Raises:
+            ValueError: If the edge is not allowed and the machine is strict
+        """
+        if new_state == self._current_state:
+            return True
+        allowed = self._ALLOWED[self._current_state]
+        if new_state not in allowed and new_state not in self._ALWAYS_ALLOWED:
+            if self._strict:
+                raise ValueError(
+                    f"Illegal transition {self._current_state.value} → {new_state.value}"
+                )
+            logger.error(
+                "[STATE] Rejected illegal transition %s → %s",
+                self._current_state.value,
+                new_state.value,
+            )
+            return False
+        logger.info(f"[STATE] {self._current_state.value} → {new_state.value}")
+        self._previous_state = self._current_state
+        self._current_state = new_state
+        return True
+
+    def fire(self, event: NavEvent) -> bool:
+        """Apply an event using the transition table.
+
+        Args:
+            event: Navigation event
+
+        Returns:
+            False if the event has no legal edge from the current state
+
+        Raises:
+            ValueError: If the event has no legal edge and the machine is strict
         """
-        if new_state != self._current_state:
-            logger.info(f"[STATE] {self._current_state.value} → {new_state.value}")
-            self._previous_state = self._current_state
-            self._current_state = new_state
+        nxt = _TRANSITIONS[_STATE_INDEX[self._current_state] * _N_EVENTS + event]
+        if nxt is None:
+            # No legal edge here: transition() logs the rejection (or raises)
+            nxt = _EVENT_TARGETS[event]
+        return self.transition(nxt)
 
     def is_state(self, state: NavState) -> bool:
         """Check if currently in a specific state.
@@ -111,49 +285,49 @@ class NavigationStateMachine:
     # Initialization
     def start(self) -> None:
         """Start navigation - transition from IDLE to PLANNING."""
-        self.transition(NavState.PLANNING)
+        self.fire(NavEvent.START)
 
     def initialize(self) -> None:
         """Initialize system - transition from IDLE to INITIALIZING."""
-        self.transition(NavState.INITIALIZING)
+        self.fire(NavEvent.INITIALIZE)
 
     def initialization_complete(self) -> None:
         """Initialization complete - transition to PLANNING."""
-        self.transition(NavState.PLANNING)
+        self.fire(NavEvent.INITIALIZATION_COMPLETE)
 
     # Per-hole navigation cycle
     def goal_set(self) -> None:
         """Goal point set - transition from PLANNING to PLOTTING_PATH."""
-        self.transition(NavState.PLOTTING_PATH)
+        self.fire(NavEvent.GOAL_SET)
 
     def path_plotted(self) -> None:
         """Path plotted - transition to FOLLOWING_PATH."""
-        self.transition(NavState.FOLLOWING_PATH)
+        self.fire(NavEvent.PATH_PLOTTED)
 
     def approaching_stop(self) -> None:
         """Approaching stop point - transition to STOPPING."""
-        self.transition(NavState.STOPPING)
+        self.fire(NavEvent.APPROACHING_STOP)
 
     def stopped(self) -> None:
         """Stopped at search zone - transition to DETECTING."""
-        self.transition(NavState.DETECTING)
+        self.fire(NavEvent.STOPPED)
 
     def hole_detected(self) -> None:
         """Hole detected - transition to CONVERTING."""
-        self.transition(NavState.CONVERTING)
+        self.fire(NavEvent.HOLE_DETECTED)
 
     def coordinates_converted(self) -> None:
         """Coordinates converted - transition to PLOTTING_PATH for refined approach."""
-        self.transition(NavState.PLOTTING_PATH)
+        self.fire(NavEvent.COORDINATES_CONVERTED)
 
     # Module execution
     def ready_for_module(self) -> None:
         """Ready for module execution - transition to MODULE_PHASE."""
-        self.transition(NavState.MODULE_PHASE)
+        self.fire(NavEvent.READY_FOR_MODULE)
 
     def module_complete(self) -> None:
         """Module execution complete - transition to UPDATING_PATTERN."""
-        self.transition(NavState.UPDATING_PATTERN)
+        self.fire(NavEvent.MODULE_COMPLETE)
 
     # Pattern update and decisions
     def pattern_updated(self, is_complete: bool, is_echelon_end: bool) -> None:
@@ -164,91 +338,104 @@ class NavigationStateMachine:
             is_echelon_end: True if at end of current echelon/row
         """
         if is_complete:
-            self.transition(NavState.RETURNING)
+            self.fire(NavEvent.PATTERN_COMPLETE)
         elif is_echelon_end:
-            self.transition(NavState.ECHELON_TURN)
+            self.fire(NavEvent.PATTERN_ECHELON_END)
         else:
-            self.transition(NavState.PLANNING)
+            self.fire(NavEvent.PATTERN_UPDATED)
 
     def echelon_turn_complete(self) -> None:
         """U-turn complete - transition back to PLANNING."""
-        self.transition(NavState.PLANNING)
+        self.fire(NavEvent.ECHELON_TURN_COMPLETE)
 
     # Error handling
     def segment_timeout_detected(self) -> None:
         """Segment timeout detected - transition to SEGMENT_TIMEOUT."""
-        self.transition(NavState.SEGMENT_TIMEOUT)
+        self.fire(NavEvent.SEGMENT_TIMEOUT)
 
     def enter_recovery(self) -> None:
         """Enter recovery mode - transition to RECOVERING."""
-        self.transition(NavState.RECOVERING)
+        self.fire(NavEvent.ENTER_RECOVERY)
 
     def retry(self) -> None:
         """Retry from RECOVERING - transition to PLANNING."""
-        self.transition(NavState.PLANNING)
+        self.fire(NavEvent.RETRY)
 
     def skip_hole(self) -> None:
         """Skip hole from RECOVERING - transition to PLANNING."""
-        self.transition(NavState.PLANNING)
+        self.fire(NavEvent.SKIP_HOLE)
 
     def abort(self) -> None:
         """Abort mission - transition to FAILED."""
-        self.transition(NavState.FAILED)
+        self.fire(NavEvent.ABORT)
 
     def emergency_stop(self) -> None:
         """Emergency stop - transition to EMERGENCY_STOP."""
-        self.transition(NavState.EMERGENCY_STOP)
+        self.fire(NavEvent.EMERGENCY_STOP)
 
     # Mission completion
     def start_return(self) -> None:
         """Start return to origin - transition to RETURNING."""
-        self.transition(NavState.RETURNING)
+        self.fire(NavEvent.START_RETURN)
 
     def mission_complete(self) -> None:
         """Mission complete - transition to COMPLETE."""
-        self.transition(NavState.COMPLETE)
+        self.fire(NavEvent.MISSION_COMPLETE)
 
     def shutdown(self) -> None:
         """Shutdown - transition to COMPLETE."""
-        self.transition(NavState.COMPLETE)
+        self.fire(NavEvent.SHUTDOWN)
 
     # Legacy compatibility methods (for gradual migration)
     def waypoint_planned(self) -> None:
         """Legacy: Waypoint planned - maps to goal_set."""
-        self.goal_set()
+        self.fire(NavEvent.GOAL_SET)
 
     def search_zone_reached(self) -> None:
         """Legacy: Search zone reached - maps to approaching_stop."""
-        self.approaching_stop()
+        self.fire(NavEvent.APPROACHING_STOP)
 
     def hole_not_found(self) -> None:
         """Legacy: Hole not found - still use CSV position, skip CONVERTING."""
-        self.transition(NavState.PLOTTING_PATH)
+        self.fire(NavEvent.HOLE_NOT_FOUND)
 
     def path_refined(self) -> None:
         """Legacy: Path refined - maps to path_plotted."""
-        self.path_plotted()
+        self.fire(NavEvent.PATH_PLOTTED)
 
     def track_complete(self) -> None:
         """Legacy: Track complete - maps to ready_for_module."""
-        self.ready_for_module()
+        self.fire(NavEvent.READY_FOR_MODULE)
 
     def track_failed(self) -> None:
         """Legacy: Track failed - maps to enter_recovery."""
-        self.enter_recovery()
+        self.fire(NavEvent.ENTER_RECOVERY)
 
     def tool_complete(self) -> None:
         """Legacy: Tool complete - maps to module_complete."""
-        self.module_complete()
+        self.fire(NavEvent.MODULE_COMPLETE)
 
     def tool_failed(self) -> None:
         """Legacy: Tool failed - maps to enter_recovery."""
-        self.enter_recovery()
+        self.fire(NavEvent.ENTER_RECOVERY)
 
     def skip(self) -> None:
         """Legacy: Skip - maps to skip_hole."""
-        self.skip_hole()
+        self.fire(NavEvent.SKIP_HOLE)
 
     def all_waypoints_complete(self) -> None:
         """Legacy: All waypoints complete - maps to mission_complete."""
-        self.mission_complete()
+        self.fire(NavEvent.MISSION_COMPLETE)
+
+
+# Flat (state, event) → next-state table, indexed as state_index * _N_EVENTS + event.
+# Built from the allowed edges; None means the event has no legal edge from that state.
+_STATE_INDEX: dict[NavState, int] = {state: i for i, state in enumerate(NavState)}
+_N_EVENTS = len(NavEvent)
+_TRANSITIONS: list[NavState | None] = [None] * (len(NavState) * _N_EVENTS)
+for _state, _state_idx in _STATE_INDEX.items():
+    _edges = NavigationStateMachine._ALLOWED[_state] | NavigationStateMachine._ALWAYS_ALLOWED
+    for _event, _target in _EVENT_TARGETS.items():
+        if _target == _state or _target in _edges:
+            _TRANSITIONS[_state_idx * _N_EVENTS + _event] = _target
+del _state, _state_idx, _edges, _event, _target
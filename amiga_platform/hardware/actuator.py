@@ -17,7 +17,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from farm_ng.core.event_client import EventClient
@@ -44,6 +44,42 @@ def _build_hbridge_cmd(hbridge_id: int, cmd: HBridgeCommandType.ValueType) -> Ac
 # Public API
 # ------------------------------
 
+@dataclass(frozen=True, slots=True)
+class PulseProgram:
+    """Precomputed open/close pulse sequence for run_program().
+
+    Build once (e.g. at module initialization) and reuse for every hole,
+    so the arguments are not re-validated on each call.
+    """
+
+    open_seconds: float
+    close_seconds: float
+    rate_hz: float = 10.0  # Command rate while driving
+    settle_before: float = 0.0
+    settle_between: float = 1.0
+    settle_after: float = 0.0
+
+    @classmethod
+    def from_durations(
+        cls,
+        open_seconds: float,
+        close_seconds: float,
+        rate_hz: float = 10.0,
+        settle_before: float = 0.0,
+        settle_between: float = 1.0,
+        settle_after: float = 0.0,
+    ) -> PulseProgram:
+        """Build from the same arguments pulse_sequence() takes, clamped once."""
+        return cls(
+            open_seconds=max(0.0, float(open_seconds)),
+            close_seconds=max(0.0, float(close_seconds)),
+            rate_hz=max(0.1, float(rate_hz)),
+            settle_before=settle_before,
+            settle_between=settle_between,
+            settle_after=settle_after,
+        )
+
+
 class BaseActuator:
     """Abstract actuator interface."""
 
@@ -113,6 +149,23 @@ class BaseActuator:
         if settle_after > 0:
             await asyncio.sleep(settle_after)
 
+    async def run_program(self, program: PulseProgram) -> None:
+        """Run a precomputed pulse sequence: [wait] → open → wait → close → [wait]."""
+        if program.settle_before > 0:
+            await asyncio.sleep(program.settle_before)
+
+        if program.open_seconds > 0:
+            await self.pulse_open(program.open_seconds, program.rate_hz)
+
+        if program.settle_between > 0:
+            await asyncio.sleep(program.settle_between)
+
+        if program.close_seconds > 0:
+            await self.pulse_close(program.close_seconds, program.rate_hz)
+
+        if program.settle_after > 0:
+            await asyncio.sleep(program.settle_after)
+
 
 class NullActuator(BaseActuator):
     """No-op actuator used when CAN is unavailable or disabled."""
@@ -134,6 +187,17 @@ class CanHBridgeActuator(BaseActuator):
     client: Optional[EventClient]
     actuator_id: int = 0
 
+    # Command messages are fixed per actuator; built once in __post_init__
+    _open_cmd: ActuatorCommands = field(init=False, repr=False)
+    _close_cmd: ActuatorCommands = field(init=False, repr=False)
+    _stop_cmd: ActuatorCommands = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the fixed OPEN/CLOSE/STOP command messages for this actuator."""
+        self._open_cmd = _build_hbridge_cmd(self.actuator_id, HBridgeCommandType.HBRIDGE_FORWARD)
+        self._close_cmd = _build_hbridge_cmd(self.actuator_id, HBridgeCommandType.HBRIDGE_REVERSE)
+        self._stop_cmd = _build_hbridge_cmd(self.actuator_id, HBridgeCommandType.HBRIDGE_STOPPED)
+
     async def _drive_for(self, command: HBridgeCommandType.ValueType, seconds: float, rate_hz: float) -> None:
         if self.client is None:
             logger.warning(
@@ -144,18 +208,21 @@ class CanHBridgeActuator(BaseActuator):
             return
         rate_hz = max(0.1, float(rate_hz))
         period = 1.0 / rate_hz
+        if command == HBridgeCommandType.HBRIDGE_FORWARD:
+            cmd = self._open_cmd
+        elif command == HBridgeCommandType.HBRIDGE_REVERSE:
+            cmd = self._close_cmd
+        else:
+            cmd = _build_hbridge_cmd(self.actuator_id, command)
         t_end = time.monotonic() + seconds
         name = HBridgeCommandType.Name(command) if hasattr(
             HBridgeCommandType, "Name") else str(command)
         logger.info("Actuator %d: %s for %.2fs @ %.1f Hz",
                     self.actuator_id, name, seconds, rate_hz)
         try:
+            # Wall-clock deadline: send round trips count against the pulse time
             while time.monotonic() < t_end:
-                await self.client.request_reply(
-                    "/control_tools",
-                    _build_hbridge_cmd(self.actuator_id, command),
-                    decode=True,
-                )
+                await self.client.request_reply("/control_tools", cmd, decode=True)
                 await asyncio.sleep(period)
         finally:
             # Always attempt a STOP at the end of any drive
@@ -171,9 +238,4 @@ class CanHBridgeActuator(BaseActuator):
         if self.client is None:
             return
         logger.info("Actuator %d: STOP", self.actuator_id)
-        await self.client.request_reply(
-            "/control_tools",
-            _build_hbridge_cmd(
-                self.actuator_id, HBridgeCommandType.HBRIDGE_STOPPED),
-            decode=True,
-        )
+        await self.client.request_reply("/control_tools", self._stop_cmd, decode=True)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from typing import TYPE_CHECKING
 
 from farm_ng.canbus.canbus_pb2 import RawCanbusMessage, Twist2d
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 # SocketCAN extended frame constants
 CAN_EFF_FLAG = 0x80000000  # SocketCAN "extended frame" flag
 CAN_EFF_MASK = 0x1FFFFFFF  # 29-bit ID mask
+_EFF_INVALID_BITS = ~CAN_EFF_MASK  # Any bit set here means the ID exceeds 29 bits
 
 
 def eff_id(arb29: int) -> int:
@@ -31,36 +33,90 @@ def eff_id(arb29: int) -> int:
     Raises:
         ValueError: If ID exceeds 29 bits
     """
-    if arb29 & ~CAN_EFF_MASK:
+    if arb29 & _EFF_INVALID_BITS:
         raise ValueError(f"ID {arb29:#x} exceeds 29 bits")
     return CAN_EFF_FLAG | arb29
 
 
-async def _send_can_signal(client: EventClient, arb29: int, payload: bytes) -> None:
-    """Send raw CAN message.
+# Dipbob deploy frame (fixed ID and payload, built once at import)
+DIPBOB_ARB_ID = 0x18FF0007  # Trigger frame ID; the ACK arrives on the same ID
+_DIPBOB_EFF_ID = eff_id(DIPBOB_ARB_ID)  # Validated once at import
+_DIPBOB_PAYLOAD = b"\x06\x00\x02\x00\x00\x00\x00\x00"
+_DIPBOB_MSG = RawCanbusMessage(
+    id=_DIPBOB_EFF_ID,
+    remote_transmission=False,  # RTR=0 (data frame)
+    error=False,
+    data=_DIPBOB_PAYLOAD,
+)
+
+# Payloads we transmit, keyed by 29-bit arbitration ID; a received frame with the
+# same ID and payload is our own frame echoed back (loopback), not an ACK
+_TX_PAYLOADS: dict[int, bytes] = {DIPBOB_ARB_ID: _DIPBOB_PAYLOAD}
+
+# Pending ACK futures keyed by 29-bit arbitration ID, oldest first, resolved in
+# order by dispatch_can_frame() so concurrent triggers each get their own ACK
+_ack_waiters: dict[int, deque[asyncio.Future]] = {}
 
-    Args:
-        client: CAN bus service client
-        arb29: 29-bit arbitration ID
-        payload: Message payload (8 bytes)
-    """
-    msg = RawCanbusMessage()
-    msg.id = eff_id(arb29)
-    msg.remote_transmission = False  # RTR=0 (data frame)
-    msg.error = False
-    msg.data = payload
-    await client.request_reply("/can_message", msg, decode=True)
 
+def dispatch_can_frame(msg: RawCanbusMessage) -> None:
+    """Route a received CAN frame to the task waiting on its arbitration ID.
 
-async def trigger_dipbob(canbus_client: EventClient) -> None:
+    Echoes of frames we transmitted are ignored. Each ACK resolves the
+    oldest pending waiter for its ID.
+
+    Args:
+        msg: Received CAN frame (extended or standard ID)
+    """
+    arb29 = msg.id & CAN_EFF_MASK
+    waiters = _ack_waiters.get(arb29)
+    if not waiters or msg.data == _TX_PAYLOADS.get(arb29):
+        return
+
+    while waiters:
+        fut = waiters.popleft()
+        if not fut.done():
+            fut.set_result(msg)
+            break
+    if not waiters:
+        del _ack_waiters[arb29]
+
+
+async def trigger_dipbob(
+    canbus_client: EventClient, ack_timeout_s: float | None = None
+) -> bool:
     """Trigger dipbob deployment via CAN signal.
 
     Args:
         canbus_client: CAN bus service client
+        ack_timeout_s: If set, wait up to this long for the ACK frame
+            (delivered through dispatch_can_frame); if None, return once sent
+
+    Returns:
+        True if the signal was sent (and acknowledged, when waiting), False on ACK timeout
     """
-    await _send_can_signal(canbus_client, 0x18FF0007, b"\x06\x00\x02\x00\x00\x00\x00\x00")
-    await asyncio.sleep(0.02)
-    logger.info("Dipbob deployment signal sent")
+    if ack_timeout_s is None:
+        await canbus_client.request_reply("/can_message", _DIPBOB_MSG, decode=True)
+        logger.info("Dipbob deployment signal sent")
+        return True
+
+    ack = asyncio.get_running_loop().create_future()
+    waiters = _ack_waiters.setdefault(DIPBOB_ARB_ID, deque())
+    waiters.append(ack)
+    try:
+        await canbus_client.request_reply("/can_message", _DIPBOB_MSG, decode=True)
+        await asyncio.wait_for(ack, timeout=ack_timeout_s)
+    except asyncio.TimeoutError:
+        logger.warning("No dipbob ACK within %ss", ack_timeout_s)
+        return False
+    finally:
+        # Drop this waiter if no ACK claimed it (timeout, send error, cancellation)
+        if ack in waiters:
+            waiters.remove(ack)
+        if not waiters and _ack_waiters.get(DIPBOB_ARB_ID) is waiters:
+            del _ack_waiters[DIPBOB_ARB_ID]
+
+    logger.info("Dipbob deployment signal acknowledged")
+    return True
 
 
 async def check_filter_convergence(
@@ -80,7 +136,7 @@ async def check_filter_convergence(
             filter_client.request_reply("/get_state", Empty(), decode=True),
             timeout=timeout,
         )
-        converged = bool(getattr(state, "has_converged", False))
+        converged = state.has_converged
         if converged:
             logger.info("Filter has converged")
         else:
@@ -90,10 +146,96 @@ async def check_filter_convergence(
         logger.warning("Timeout checking filter convergence")
         return False
     except Exception as e:
-        logger.error(f"Error checking filter convergence: {e}")
+        logger.error("Error checking filter convergence: %s", e)
         return False
 
 
+async def _poll_until_converged(
+    filter_client: EventClient, interval: float = 0.1, timeout: float = 2.0
+) -> bool:
+    """Poll filter state until it reports convergence.
+
+    Args:
+        filter_client: EventClient for the filter service
+        interval: Delay between polls in seconds
+        timeout: Give up after this many seconds
+
+    Returns:
+        True as soon as the filter reports convergence, False on timeout or error
+    """
+
+    async def _poll() -> bool:
+        while True:
+            state: FilterState = await filter_client.request_reply(
+                "/get_state", Empty(), decode=True
+            )
+            if state.has_converged:
+                return True
+            await asyncio.sleep(interval)
+
+    try:
+        return await asyncio.wait_for(_poll(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return False
+    except Exception as e:
+        logger.error("Error polling filter convergence: %s", e)
+        return False
+
+
+async def _send_twist_for(
+    canbus_client: EventClient,
+    twist: Twist2d,
+    duration_s: float,
+    period_s: float = 0.05,
+    max_in_flight: int = 4,
+) -> None:
+    """Send a twist command at a fixed cadence for a duration.
+
+    Sends are issued on absolute period boundaries without waiting for each
+    reply, so request_reply RTT no longer stretches the interval. At most
+    max_in_flight requests are outstanding; all are drained before returning.
+
+    Args:
+        canbus_client: EventClient for the canbus service
+        twist: Twist command to send (must not be mutated until this returns)
+        duration_s: How long to hold the command
+        period_s: Send period in seconds (0.05 = 20 Hz)
+        max_in_flight: Maximum concurrent outstanding requests
+    """
+    loop = asyncio.get_running_loop()
+    in_flight = asyncio.Semaphore(max_in_flight)
+    pending: set[asyncio.Task] = set()
+
+    async def _send() -> None:
+        try:
+            await canbus_client.request_reply("/twist", twist)
+        finally:
+            in_flight.release()
+
+    # Single timer marks the end of this command instead of polling the loop clock
+    done = asyncio.Event()
+    handle = loop.call_later(duration_s, done.set)
+    next_t = loop.time()
+    try:
+        while not done.is_set():
+            await in_flight.acquire()
+            task = asyncio.create_task(_send())
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+            next_t += period_s
+            await asyncio.sleep(max(0.0, next_t - loop.time()))
+
+        if pending:
+            await asyncio.gather(*pending)
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+    finally:
+        handle.cancel()
+
+
 async def imu_wiggle(
     canbus_client: EventClient,
     filter_client: EventClient | None = None,
@@ -120,6 +262,8 @@ async def imu_wiggle(
     Returns:
         True if filter converged (or if not checking), False if still diverged after max attempts
     """
+    # Resolve log level once; per-attempt messages below are skipped entirely when INFO is off
+    info_on = logger.isEnabledFor(logging.INFO)
     logger.info("Starting IMU wiggle to help filter converge...")
 
     # Check initial convergence state
@@ -130,58 +274,62 @@ async def imu_wiggle(
             logger.info("Filter already converged, no wiggle needed")
             return True
 
+    # Wiggle pattern: left -> right -> left -> right
+    wiggle_cycle_duration = duration_seconds / 4  # Quarter of total time per direction
+    directions = (angular_velocity, -angular_velocity, angular_velocity, -angular_velocity)
+
+    # One twist message reused for every send; only angular_velocity is mutated,
+    # and only after all in-flight sends for the previous direction have drained
+    twist = Twist2d(linear_velocity_x=0.0, angular_velocity=0.0)
+
     attempt = 0
     while attempt < max_attempts:
         attempt += 1
-        logger.info(
-            f"Wiggle attempt {attempt}/{max_attempts} - "
-            f"Duration: {duration_seconds}s, Angular vel: ±{angular_velocity} rad/s"
-        )
-
-        # Wiggle pattern: left -> right -> left -> right
-        wiggle_cycle_duration = duration_seconds / 4  # Quarter of total time per direction
-        directions = [
-            angular_velocity,
-            -angular_velocity,
-            angular_velocity,
-            -angular_velocity,
-        ]
+        if info_on:
+            logger.info(
+                "Wiggle attempt %d/%d - Duration: %ss, Angular vel: ±%s rad/s",
+                attempt,
+                max_attempts,
+                duration_seconds,
+                angular_velocity,
+            )
 
         for ang_vel in directions:
-            # Send twist command for this direction
-            twist = Twist2d(linear_velocity_x=0.0, angular_velocity=ang_vel)
+            twist.angular_velocity = ang_vel
 
-            start_time = asyncio.get_event_loop().time()
-            end_time = start_time + wiggle_cycle_duration
-
-            # Hold this direction for the cycle duration
-            while asyncio.get_event_loop().time() < end_time:
-                await canbus_client.request_reply("/twist", twist)
-                await asyncio.sleep(0.05)  # Send at 20 Hz
+            # Hold this direction for the cycle duration at a true 20 Hz
+            await _send_twist_for(canbus_client, twist, wiggle_cycle_duration, period_s=0.05)
 
         # Stop the robot
-        stop_twist = Twist2d(linear_velocity_x=0.0, angular_velocity=0.0)
-        await canbus_client.request_reply("/twist", stop_twist)
-        logger.info("Wiggle complete, robot stopped")
-
-        # Wait a moment for filter to settle
-        await asyncio.sleep(0.5)
+        twist.angular_velocity = 0.0
+        await canbus_client.request_reply("/twist", twist)
+        if info_on:
+            logger.info("Wiggle complete, robot stopped")
 
         # Check if filter converged
         if filter_client and check_convergence:
-            converged = await check_filter_convergence(filter_client)
+            # Poll convergence while the robot settles; returns after
+            # max(settle, first converged poll) instead of settle + RTT
+            _, converged = await asyncio.gather(
+                asyncio.sleep(0.2),
+                _poll_until_converged(filter_client, interval=0.1, timeout=2.0),
+            )
             if converged:
-                logger.info(f"✓ Filter converged after {attempt} wiggle attempt(s)!")
+                if info_on:
+                    logger.info("✓ Filter converged after %d wiggle attempt(s)!", attempt)
                 return True
             else:
                 logger.warning(
-                    f"Filter still diverged after attempt {attempt}/{max_attempts}"
+                    "Filter still diverged after attempt %d/%d", attempt, max_attempts
                 )
         else:
+            # Wait a moment for filter to settle
+            await asyncio.sleep(0.5)
+
             # If not checking convergence, assume success after wiggling
             logger.info("Wiggle complete (convergence check disabled)")
             return True
 
     # Failed to converge after max attempts
-    logger.error(f"✗ Filter did not converge after {max_attempts} wiggle attempts")
+    logger.error("✗ Filter did not converge after %d wiggle attempts", max_attempts)
     return False
@@ -16,10 +16,15 @@ from farm_ng_core_pybind import Isometry3F64, Pose3F64, Rotation3F64
 
 logger = logging.getLogger(__name__)
 
+# Waypoint CSV columns read by load_waypoints_from_csv (matched case-insensitively)
+_CSV_COLUMNS = frozenset({"dx", "dy", "yaw_deg"})
+
 
 class CoordinateTransforms:
     """Handle all coordinate transformations."""
 
+    __slots__ = ("robot_from_tool",)
+
     def __init__(self, tool_config: dict) -> None:
         """Initialize with tool offset.
 
@@ -58,36 +63,40 @@ class CoordinateTransforms:
         Returns:
             Dictionary mapping waypoint_index → world_from_hole pose
         """
-        df = pd.read_csv(csv_path)
+        # Parse only the columns used, straight to float64 with the C parser
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda col: col.strip().lower() in _CSV_COLUMNS,
+            dtype=np.float64,
+            engine="c",
+        )
         df.columns = df.columns.str.strip().str.lower()
 
         # ENU → NWU conversion
         # ENU: X=East, Y=North, Z=Up
         # NWU: X=North, Y=West, Z=Up
         # Therefore: NWU_X = ENU_Y, NWU_Y = -ENU_X
-        north = df["dy"].astype(float).to_numpy()
-        west = (-df["dx"].astype(float)).to_numpy()
+        north = df["dy"].to_numpy()
+        west = -df["dx"].to_numpy()
 
         # Heading inference
         if "yaw_deg" in df.columns:
-            yaw = np.deg2rad(df["yaw_deg"].astype(float).to_numpy())
+            yaw = np.deg2rad(df["yaw_deg"].to_numpy())
         else:
             yaw = self._infer_yaw_from_path(north, west, last_row_index)
 
-        # Build poses
-        poses = {}
+        # Build poses from one (N, 3) translation array
+        xyz = np.column_stack((north, west, np.zeros_like(north)))
         zero_tangent = np.zeros((6, 1), dtype=np.float64)
-
-        for i, (n, w, th) in enumerate(zip(north, west, yaw), start=1):
-            iso = Isometry3F64(
-                np.array([n, w, 0.0], dtype=np.float64), Rotation3F64.Rz(float(th))
-            )
-            poses[i] = Pose3F64(
-                a_from_b=iso,
+        poses = {
+            i: Pose3F64(
+                a_from_b=Isometry3F64(t, Rotation3F64.Rz(th)),
                 frame_a="world",
                 frame_b="hole",
                 tangent_of_b_in_a=zero_tangent,
             )
+            for i, (t, th) in enumerate(zip(xyz, yaw.tolist()), start=1)
+        }
 
         logger.info(f"Loaded {len(poses)} waypoints from {csv_path}")
         return poses
@@ -106,25 +115,33 @@ class CoordinateTransforms:
         Returns:
             Dictionary of robot navigation targets in world frame
         """
+        if not hole_poses:
+            return {}
+
+        # Inverse of robot_from_tool gives us hole_from_robot; the tool offset
+        # is a pure translation, so every robot target keeps its hole's rotation
+        hole_from_robot = self.robot_from_tool.inverse()
+        offset = np.asarray(hole_from_robot.a_from_b.translation, dtype=np.float64)
+
+        # Flatten once into contiguous arrays, then compose all holes at once:
+        # world_from_robot = world_from_hole * hole_from_robot
+        indices = list(hole_poses)
+        isos = [hole_poses[idx].a_from_b for idx in indices]
+        xyz = np.stack([iso.translation for iso in isos])  # (N, 3)
+        rot = np.stack([iso.rotation.rotation_matrix for iso in isos])  # (N, 3, 3)
+        targets = xyz + np.einsum("nij,j->ni", rot, offset)
+
+        # Back to Pose3F64 only at the API boundary
+        zero_tangent = np.zeros((6, 1), dtype=np.float64)
         robot_poses = {}
-
-        for idx, hole_pose in hole_poses.items():
-            world_from_hole = Pose3F64(
-                a_from_b=hole_pose.a_from_b,
+        for idx, iso, xyz_robot in zip(indices, isos, targets):
+            robot_poses[idx] = Pose3F64(
+                a_from_b=Isometry3F64(xyz_robot, iso.rotation),
                 frame_a="world",
-                frame_b="hole",
-                tangent_of_b_in_a=hole_pose.tangent_of_b_in_a,
+                frame_b="robot",
+                tangent_of_b_in_a=zero_tangent,
             )
 
-            # Inverse of robot_from_tool gives us hole_from_robot
-            hole_from_robot = self.robot_from_tool.inverse()
-            hole_from_robot.frame_a = "hole"
-            hole_from_robot.frame_b = "robot"
-
-            # Compose: world_from_robot = world_from_hole * hole_from_robot
-            world_from_robot = world_from_hole * hole_from_robot
-            robot_poses[idx] = world_from_robot
-
         return robot_poses
 
     def _infer_yaw_from_path(
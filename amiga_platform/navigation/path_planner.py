@@ -1,11 +1,13 @@
 """Path planning and waypoint management."""
 from __future__ import annotations
 
+import functools
 import logging
+from math import hypot, pi, radians
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
-import numpy as np
+from farm_ng.filter.filter_pb2 import FilterState
 from farm_ng.track.track_pb2 import Track
 from farm_ng_core_pybind import Isometry3F64, Pose3F64
 from google.protobuf.empty_pb2 import Empty
@@ -20,10 +22,36 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# A cached approach track is reused if the start pose moved less than this
+_APPROACH_REUSE_TOL_M = 0.05
+_APPROACH_REUSE_TOL_RAD = 0.02
+
+
+@functools.lru_cache(maxsize=32)
+def _expanded(path: str | Path) -> Path:
+    """Expand ~ in a configured path, once per distinct path."""
+    return Path(path).expanduser()
+
 
 class PathPlanner:
     """Manages waypoint sequence and track segment generation."""
 
+    __slots__ = (
+        "config",
+        "filter_client",
+        "transforms",
+        "hole_poses",
+        "waypoints",
+        "current_index",
+        "row_end_segment_index",
+        "_hole_poses_list",
+        "_waypoint_items",
+        "_waypoint_iter",
+        "_row_end_last_pose",
+        "_row_end_ops",
+        "_last_approach",
+    )
+
     def __init__(
         self,
         waypoint_config: WaypointConfig,
@@ -51,19 +79,47 @@ class PathPlanner:
 
         # Load waypoints
         hole_poses = self.transforms.load_waypoints_from_csv(
-            Path(waypoint_config.csv_path).expanduser(),
+            _expanded(waypoint_config.csv_path),
             waypoint_config.last_row_waypoint_index,
         )
 
         # Store original hole positions (for vision search zones)
         self.hole_poses = hole_poses.copy()
 
+        # Same poses indexed by waypoint index in a list (slot 0 unused: indices start at 1)
+        self._hole_poses_list: list[Pose3F64 | None] = [None] * (max(hole_poses, default=0) + 1)
+        for idx, pose in hole_poses.items():
+            self._hole_poses_list[idx] = pose
+
         # Transform to robot navigation targets
         self.waypoints = self.transforms.transform_holes_to_robot_targets(hole_poses)
 
+        # Sequential access in index order, without a dict lookup per advance
+        self._waypoint_items: list[tuple[int, Pose3F64]] = sorted(self.waypoints.items())
+        self._waypoint_iter = iter(self._waypoint_items)
+
         # Navigation state
         self.current_index = 0
         self.row_end_segment_index = 1
+        self._row_end_last_pose: Pose3F64 | None = None  # End of last planned row-end segment
+
+        # Last approach plan: ((goal_x, goal_y, offset_m, current_index), start x/y/heading, track)
+        self._last_approach: tuple[tuple, tuple[float, float, float], Track] | None = None
+
+        # Row-end U-turn segments, in order; turn angle and sign resolved once
+        turn_rad = radians(90) * (1 if waypoint_config.turn_direction == "left" else -1)
+        headland_m = waypoint_config.headland_buffer_m
+        row_spacing_m = waypoint_config.row_spacing_m
+        self._row_end_ops: tuple[Callable[[TrackBuilder], None], ...] = (
+            # Drive into headland
+            lambda b: b.create_straight_segment("row_end_1", distance=headland_m, spacing=0.5),
+            # Turn 90°
+            lambda b: b.create_turn_segment("row_end_2", angle=turn_rad, spacing=0.15),
+            # Lateral movement
+            lambda b: b.create_straight_segment("row_end_3", distance=row_spacing_m, spacing=0.5),
+            # Turn 90° again
+            lambda b: b.create_turn_segment("row_end_4", angle=turn_rad, spacing=0.15),
+        )
 
         logger.info(f"Loaded {len(self.waypoints)} waypoints")
 
@@ -73,8 +129,6 @@ class PathPlanner:
         Returns:
             Current robot pose in world frame
         """
-        from farm_ng.filter.filter_pb2 import FilterState
-
         state: FilterState = await self.filter_client.request_reply(
             "/get_state", Empty(), decode=True
         )
@@ -86,22 +140,22 @@ class PathPlanner:
         Returns:
             Tuple of (waypoint_index, waypoint_pose) or None if complete
         """
-        if self.current_index >= len(self.waypoints):
-            return None
-
-        self.current_index += 1
-        return (self.current_index, self.waypoints[self.current_index])
+        nxt = next(self._waypoint_iter, None)
+        if nxt is not None:
+            self.current_index = nxt[0]
+        return nxt
 
     def get_hole_position(self, index: int) -> Pose3F64 | None:
         """Get original hole position (for vision search zone).
 
         Args:
-            index: Waypoint index
+            index: Waypoint index (1-based, as in hole_poses)
 
         Returns:
             Hole position pose or None if not found
         """
-        return self.hole_poses.get(index)
+        poses = self._hole_poses_list
+        return poses[index] if 0 <= index < len(poses) else None
 
     async def plan_segment(
         self, start: Pose3F64, goal: Pose3F64, spacing: float = 0.5
@@ -125,28 +179,67 @@ class PathPlanner:
         return builder.track
 
     async def plan_approach_segment(
-        self, goal: Pose3F64, offset_m: float = 1.2
+        self, goal: Pose3F64, offset_m: float = 1.2, current: Pose3F64 | None = None
     ) -> Track:
         """Create segment stopping before goal for vision detection.
 
+        Replanning the same approach from (nearly) the same start pose, e.g.
+        after a rejected track or a missed prefetch, reuses the previous track
+        instead of rebuilding it.
+
         Args:
             goal: Target waypoint
             offset_m: Distance to stop before goal
+            current: Start pose; fetched from the filter if not given
 
         Returns:
             Track segment to approach position
         """
-        current = await self.get_current_pose()
+        if current is None:
+            current = await self.get_current_pose()
 
         # Calculate approach position
         goal_x = goal.a_from_b.translation[0]
         goal_y = goal.a_from_b.translation[1]
         curr_x = current.a_from_b.translation[0]
         curr_y = current.a_from_b.translation[1]
+        curr_heading = current.a_from_b.rotation.log()[-1]
+
+        # Fast path: same goal and waypoint, robot has not moved since the last plan
+        key = (goal_x, goal_y, offset_m, self.current_index)
+        cached = self._last_approach
+        if cached is not None and cached[0] == key:
+            start_x, start_y, start_heading = cached[1]
+            moved = hypot(curr_x - start_x, curr_y - start_y) > _APPROACH_REUSE_TOL_M
+            heading_err = abs((curr_heading - start_heading + pi) % (2 * pi) - pi)
+            if not moved and heading_err <= _APPROACH_REUSE_TOL_RAD:
+                return cached[2]
+
+        track = await self._build_approach_segment(goal, offset_m, current)
+        self._last_approach = (key, (curr_x, curr_y, curr_heading), track)
+        return track
+
+    async def _build_approach_segment(
+        self, goal: Pose3F64, offset_m: float, current: Pose3F64
+    ) -> Track:
+        """Build the approach segment for plan_approach_segment().
+
+        Args:
+            goal: Target waypoint
+            offset_m: Distance to stop before goal
+            current: Start pose
+
+        Returns:
+            Track segment to approach position
+        """
+        goal_x = goal.a_from_b.translation[0]
+        goal_y = goal.a_from_b.translation[1]
+        curr_x = current.a_from_b.translation[0]
+        curr_y = current.a_from_b.translation[1]
 
         dx = goal_x - curr_x
         dy = goal_y - curr_y
-        dist = np.hypot(dx, dy)
+        dist = hypot(dx, dy)
 
         if dist <= offset_m:
             # Too close, go direct
@@ -177,41 +270,34 @@ class PathPlanner:
         """
         return self.current_index == self.config.last_row_waypoint_index
 
-    async def plan_row_end_maneuver(self) -> Track | None:
+    def reset_row_end_maneuver(self) -> None:
+        """Restart the row-end maneuver from its first segment."""
+        self.row_end_segment_index = 1
+        self._row_end_last_pose = None
+
+    async def plan_row_end_maneuver(self, chain: bool = False) -> Track | None:
         """Create 4-segment U-turn for row end.
 
+        Args:
+            chain: Start from the end of the previously planned segment instead of
+                the current filter pose, so a segment can be planned while the
+                previous one is still executing
+
         Returns:
             Next segment in row-end maneuver, or None if complete
         """
-        if self.row_end_segment_index > 4:
-            self.row_end_segment_index = 1  # Reset for next row
+        if self.row_end_segment_index > len(self._row_end_ops):
+            self.reset_row_end_maneuver()  # Reset for next row
             return None
 
-        current = await self.get_current_pose()
+        if chain and self._row_end_last_pose is not None:
+            current = self._row_end_last_pose
+        else:
+            current = await self.get_current_pose()
         builder = TrackBuilder(start=current)
 
-        if self.row_end_segment_index == 1:
-            # Drive into headland
-            builder.create_straight_segment(
-                "row_end_1", distance=self.config.headland_buffer_m, spacing=0.5
-            )
-        elif self.row_end_segment_index == 2:
-            # Turn 90°
-            angle = np.radians(90) * (
-                1 if self.config.turn_direction == "left" else -1
-            )
-            builder.create_turn_segment("row_end_2", angle=angle, spacing=0.15)
-        elif self.row_end_segment_index == 3:
-            # Lateral movement
-            builder.create_straight_segment(
-                "row_end_3", distance=self.config.row_spacing_m, spacing=0.5
-            )
-        elif self.row_end_segment_index == 4:
-            # Turn 90° again
-            angle = np.radians(90) * (
-                1 if self.config.turn_direction == "left" else -1
-            )
-            builder.create_turn_segment("row_end_4", angle=angle, spacing=0.15)
+        self._row_end_ops[self.row_end_segment_index - 1](builder)
 
         self.row_end_segment_index += 1
+        self._row_end_last_pose = builder.track_waypoints[-1]
         return builder.track
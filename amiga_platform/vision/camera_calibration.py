@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import numpy as np
 from farm_ng.oak import oak_pb2
@@ -14,10 +14,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Camera axis alignment (DepthAI → NWU), a fixed axis swap computed once at import
+# DepthAI: X=Right, Y=Down, Z=Forward
+# NWU: X=North/Forward, Y=West/Left, Z=Up
+R_ALIGN_DEPTHAI_TO_NWU = Rotation3F64.Rx(np.radians(-90)) * Rotation3F64.Ry(np.radians(90))
+
 
 class CameraCalibration:
     """Manage camera intrinsics and extrinsics."""
 
+    __slots__ = (
+        "oak_client",
+        "config",
+        "intrinsics",
+        "robot_from_camera",
+        "_R_rc",
+        "_t_rc",
+        "_rot_rc",
+    )
+
     def __init__(self, oak_client: EventClient, config: dict) -> None:
         """Initialize camera calibration.
 
@@ -32,6 +47,11 @@ class CameraCalibration:
         self.intrinsics: dict | None = None
         self.robot_from_camera: Pose3F64 | None = None
 
+        # Raw rotation/translation of robot_from_camera for per-detection math
+        self._R_rc: np.ndarray | None = None
+        self._t_rc: np.ndarray | None = None
+        self._rot_rc: Rotation3F64 | None = None  # Same rotation, as a pybind object
+
     async def load_calibration(self) -> None:
         """Load intrinsics from camera and extrinsics from config."""
         # Get intrinsics from oak service
@@ -46,7 +66,7 @@ class CameraCalibration:
             "fy": cam_data.intrinsic_matrix[4],
             "cx": cam_data.intrinsic_matrix[2],
             "cy": cam_data.intrinsic_matrix[5],
-            "distortion": np.array(cam_data.distortion_coeff),
+            "distortion": np.array(cam_data.distortion_coeff, dtype=np.float32),
         }
 
         # Build robot_from_camera transformation
@@ -55,22 +75,20 @@ class CameraCalibration:
         tz = self.config["offset_z"]
         pitch_deg = self.config.get("pitch_deg", 0.0)
 
-        # Camera axis alignment (DepthAI → NWU)
-        # DepthAI: X=Right, Y=Down, Z=Forward
-        # NWU: X=North/Forward, Y=West/Left, Z=Up
-        R_align = Rotation3F64.Rx(np.radians(-90)) * Rotation3F64.Ry(np.radians(90))
-
         # Camera tilt (pitch down is negative in robot frame)
         R_tilt = Rotation3F64.Rx(np.radians(-pitch_deg))
 
         # Combined rotation
-        R_total = R_align * R_tilt
+        R_total = R_ALIGN_DEPTHAI_TO_NWU * R_tilt
 
         self.robot_from_camera = Pose3F64(
             a_from_b=Isometry3F64([tx, ty, tz], R_total),
             frame_a="robot",
             frame_b="camera",
         )
+        self._R_rc = np.asarray(R_total.rotation_matrix, dtype=np.float64)
+        self._t_rc = np.array([tx, ty, tz], dtype=np.float64)
+        self._rot_rc = R_total
 
         logger.info(f"Camera calibration loaded: fx={self.intrinsics['fx']:.1f}")
 
@@ -106,11 +124,28 @@ class CameraCalibration:
 
         return np.array([x, y, z], dtype=float)
 
-    def camera_to_robot(self, p_cam: np.ndarray) -> Pose3F64:
+    def camera_to_robot_xyz(self, p_cam: np.ndarray | Sequence[float]) -> np.ndarray:
+        """Transform a camera-frame point to robot frame as a plain array.
+
+        One matrix-vector product on the cached robot_from_camera; use
+        camera_to_robot() where a Pose3F64 is needed.
+
+        Args:
+            p_cam: 3D point in camera frame, or points with shape (N, 3)
+
+        Returns:
+            Point(s) in robot frame (meters), same shape as p_cam
+        """
+        if self._R_rc is None:
+            raise RuntimeError("Calibration not loaded")
+
+        return np.asarray(p_cam, dtype=np.float64) @ self._R_rc.T + self._t_rc
+
+    def camera_to_robot(self, p_cam: np.ndarray | Sequence[float]) -> Pose3F64:
         """Transform camera detection to robot frame.
 
         Args:
-            p_cam: 3D point in camera frame
+            p_cam: 3D point in camera frame (array or x, y, z sequence)
 
         Returns:
             Pose in robot frame
@@ -118,9 +153,10 @@ class CameraCalibration:
         if self.robot_from_camera is None:
             raise RuntimeError("Calibration not loaded")
 
-        camera_from_object = Pose3F64(
-            a_from_b=Isometry3F64(p_cam.tolist(), Rotation3F64()),
-            frame_a="camera",
+        # camera_from_object has identity rotation, so robot_from_object keeps
+        # robot_from_camera's rotation and only the point needs transforming
+        return Pose3F64(
+            a_from_b=Isometry3F64(self.camera_to_robot_xyz(p_cam), self._rot_rc),
+            frame_a="robot",
             frame_b="object",
         )
-        return self.robot_from_camera * camera_from_object
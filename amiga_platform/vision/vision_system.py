@@ -67,9 +67,16 @@ class VisionSystem:
         logger.info("Vision system initialized")
 
     async def initialize(self) -> None:
-        """Load camera calibrations."""
-        await self.forward_cal.load_calibration()
-        await self.downward_cal.load_calibration()
+        """Load camera calibrations.
+
+        Each calibration only touches its own camera client and state, so
+        both are fetched concurrently, and this is safe to gather with other
+        startup RPCs.
+        """
+        await asyncio.gather(
+            self.forward_cal.load_calibration(),
+            self.downward_cal.load_calibration(),
+        )
         logger.info("Camera calibrations loaded")
 
     async def detect_hole_forward(
@@ -89,7 +96,8 @@ class VisionSystem:
             Refined hole position or None if not detected
         """
         logger.info("Starting forward hole detection...")
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         self.averager.clear()
 
         # Subscribe to RGB stream from oak/1
@@ -100,7 +108,7 @@ class VisionSystem:
         try:
             async for event, msg in self.oak1.subscribe(rgb_sub, decode=True):
                 # Check timeout
-                elapsed = asyncio.get_event_loop().time() - start_time
+                elapsed = loop.time() - start_time
                 if elapsed > timeout_s:
                     logger.warning("Vision detection timeout")
                     return None
@@ -126,7 +134,7 @@ class VisionSystem:
                     best.x_norm + best.width_norm / 2,
                     best.y_norm + best.height_norm / 2,
                     best.confidence,
-                    asyncio.get_event_loop().time(),
+                    loop.time(),
                 )
 
                 # Check if we have enough detections
@@ -159,7 +167,8 @@ class VisionSystem:
             True if aligned within tolerance
         """
         logger.info("Checking tool alignment with downward camera...")
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
         # Subscribe to RGB stream from oak/0
         rgb_sub = SubscribeRequest(uri=Uri(path="/rgb", query="service_name=oak/0"))
@@ -167,7 +176,7 @@ class VisionSystem:
         try:
             async for event, msg in self.oak0.subscribe(rgb_sub, decode=True):
                 # Check timeout
-                elapsed = asyncio.get_event_loop().time() - start_time
+                elapsed = loop.time() - start_time
                 if elapsed > timeout_s:
                     logger.warning("Alignment check timeout")
                     return False
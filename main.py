@@ -3,25 +3,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
+import dataclasses
 import logging
+import math
 import signal
 import sys
 from pathlib import Path
+from typing import Callable
 
 # Import module system
-from modules.base_module import BaseModule, ModuleContext, ModuleResult
+from modules.base_module import ModuleContext, execute_with_retry
+from modules.can_dispatcher import CanDispatcher
 from modules.registry import get_global_registry
-import modules.xstem  # Auto-registers xstem module
 
 # Import platform components
 from amiga_platform.core.blast_pattern import BlastPattern
 from amiga_platform.core.config import XStemConfig
 from amiga_platform.core.service_manager import ServiceManager
-from amiga_platform.core.state_machine import NavigationStateMachine, NavState
+from amiga_platform.core.state_machine import NavEvent, NavigationStateMachine
 from amiga_platform.hardware.filter_utils import check_filter_convergence, imu_wiggle
 from amiga_platform.navigation.navigation_manager import NavigationManager
 from amiga_platform.navigation.path_planner import PathPlanner
-from amiga_platform.vision.vision_system import VisionSystem
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +32,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Map tool.type to module name (temporary until multi-tier config is integrated)
+_TOOL_TYPE_TO_MODULE: dict[str, str] = {
+    "stemming": "xstem",
+    "none": "none",
+    "priming": "xprime",  # For future
+}
+
 
 class XStemNavigator:
     """Main navigation orchestrator."""
@@ -52,9 +62,22 @@ class XStemNavigator:
         self.vision = None
         self.module = None
         self.blast_pattern = None
+        self.can_dispatcher = None
+        self._wp_targets = []
+        self._exec_ctx = None
+        self._is_echelon_end = b""
+        self._next_approach = None  # (hole index, planning task) prefetched during module execution
+        self._run_task: asyncio.Task | None = None  # Task executing run(), cancelled on shutdown request
+        self._loop: asyncio.AbstractEventLoop | None = None  # Running loop, captured in setup()
+        # Teardown callbacks, registered as each resource comes up and run in reverse
+        self._exit_stack = contextlib.AsyncExitStack()
+
+        # Module config is invariant for the mission; build the dict once
+        self._tool_cfg_dict = self.config.tool.dict()
 
     async def setup(self) -> None:
         """Initialize all components."""
+        self._loop = asyncio.get_running_loop()
         logger.info("Initializing XStem navigation system...")
 
         # Path planner
@@ -64,63 +87,84 @@ class XStemNavigator:
             self.services.filter,
         )
 
+        # Dense navigation targets aligned to hole index
+        # (PathPlanner waypoints are 1-indexed by CSV row)
+        self._wp_targets = [
+            self.path_planner.waypoints[i + 1] for i in range(len(self.path_planner.waypoints))
+        ]
+
         # Blast pattern (mission state tracking)
         csv_name = Path(str(self.config.waypoints.csv_path)).stem  # Get filename without extension
         self.blast_pattern = BlastPattern(
-            holes=self.path_planner.hole_poses,  # Original hole positions
+            holes=list(self.path_planner.hole_poses.values()),  # Original hole positions, in hole order
             last_row_waypoint_index=self.config.waypoints.last_row_waypoint_index,
             mission_name=f"mission_{csv_name}",
         )
 
+        # Row-end membership is static for the mission; precompute a per-hole flag table
+        self._is_echelon_end = bytes(
+            self.blast_pattern.is_echelon_end(i) for i in range(len(self._wp_targets))
+        )
+
         # Navigation manager
         self.nav_manager = NavigationManager(
             self.services.track_follower,
             self.services.filter,
         )
         await self.nav_manager.start_monitoring()
+        self._exit_stack.push_async_callback(self.nav_manager.shutdown)
 
-        # Vision system
+        # Vision system (imported only when enabled; pulls in OpenCV and the detector)
         if self.config.vision.enabled:
+            from amiga_platform.vision.vision_system import VisionSystem
+
             self.vision = VisionSystem(
                 self.services.oak0,
                 self.services.oak1,
                 self.config.vision.forward_camera.dict(),
                 self.config.vision.downward_camera.dict(),
             )
-            await self.vision.initialize()
+            # Calibration fetches and the filter check are independent RPCs
+            _, converged = await asyncio.gather(
+                self.vision.initialize(),
+                check_filter_convergence(self.services.filter),
+            )
         else:
             logger.info("Vision system disabled")
             self.vision = None
+            converged = None
 
         # Load module via registry
-        # Map tool.type to module name (temporary until multi-tier config is integrated)
         tool_type = self.config.tool.type
-        module_name_map = {
-            "stemming": "xstem",
-            "none": "none",
-            "priming": "xprime",  # For future
-        }
-        module_name = module_name_map.get(tool_type, "none")
-        logger.info(f"Loading module: {module_name} (tool type: {tool_type})")
+        module_name = _TOOL_TYPE_TO_MODULE.get(tool_type, "none")
+        logger.info("Loading module: %s (tool type: %s)", module_name, tool_type)
+
+        # Shared CAN receive dispatcher; the stream opens when a module registers a handler
+        self.can_dispatcher = CanDispatcher(self.services.canbus)
+        self._exit_stack.push_async_callback(self.can_dispatcher.stop)
+
+        # Base execution context; run() derives each hole's context from it by
+        # replacing the per-hole fields (hole_position, robot_pose, waypoint_index)
+        self._exec_ctx = ModuleContext(
+            hole_position=None,  # Will be provided during execute()
+            robot_pose=None,     # Will be provided during execute()
+            waypoint_index=0,    # Will be provided during execute()
+            canbus_client=self.services.canbus,
+            filter_client=self.services.filter,
+            vision_system=self.vision,
+            module_config=self._tool_cfg_dict,
+            can_dispatcher=self.can_dispatcher,
+        )
 
+        # Load only the selected module, so unused tool stacks are never imported
         registry = get_global_registry()
         try:
-            ModuleClass = registry.get(module_name)
-            self.module = ModuleClass()
-            logger.info(f"✓ Module instantiated: {self.module.module_name}")
+            registry.load(module_name)
+            self.module = registry.get_instance(module_name)
+            logger.info("✓ Module instantiated: %s", self.module.module_name)
 
             # Initialize module with platform context
-            context = ModuleContext(
-                hole_position=None,  # Will be provided during execute()
-                robot_pose=None,     # Will be provided during execute()
-                waypoint_index=0,    # Will be provided during execute()
-                canbus_client=self.services.canbus,
-                filter_client=self.services.filter,
-                vision_system=self.vision if hasattr(self, 'vision') else None,
-                module_config=self.config.tool.dict() if hasattr(self.config.tool, 'dict') else {}
-            )
-
-            await self.module.initialize(context)
+            await self.module.initialize(self._exec_ctx)
 
             # Verify module readiness
             if not await self.module.verify_ready():
@@ -129,9 +173,8 @@ class XStemNavigator:
                 logger.info("✓ Module ready")
 
         except KeyError:
-            logger.warning(f"Module '{module_name}' not found in registry, using NullModule")
-            ModuleClass = registry.get("none")
-            self.module = ModuleClass()
+            logger.warning("Module '%s' not found in registry, using NullModule", module_name)
+            self.module = registry.get_instance("none")
             await self.module.initialize(ModuleContext(
                 hole_position=None,
                 robot_pose=None,
@@ -142,8 +185,11 @@ class XStemNavigator:
                 module_config={}
             ))
 
-        # Check filter convergence
-        converged = await check_filter_convergence(self.services.filter)
+        self._exit_stack.push_async_callback(self.module.shutdown)
+
+        # Check filter convergence (already checked alongside vision setup if enabled)
+        if converged is None:
+            converged = await check_filter_convergence(self.services.filter)
         if not converged:
             logger.warning("Filter not converged, attempting IMU wiggle...")
             await imu_wiggle(
@@ -158,7 +204,8 @@ class XStemNavigator:
     async def run(self) -> None:
         """Main navigation loop."""
         logger.info("Starting navigation...")
-        self.state_machine.start()
+        self._run_task = asyncio.current_task()
+        self.state_machine.fire(NavEvent.START)
 
         try:
             while not self.shutdown_requested and not self.state_machine.is_terminal():
@@ -169,134 +216,272 @@ class XStemNavigator:
                     logger.info("All holes completed")
                     stats = self.blast_pattern.get_completion_stats()
                     logger.info(
-                        f"Mission complete: {stats['completed']} completed, "
-                        f"{stats['failed']} failed, {stats['skipped']} skipped"
+                        "Mission complete: %d completed, %d failed, %d skipped",
+                        stats['completed'],
+                        stats['failed'],
+                        stats['skipped'],
                     )
-                    self.state_machine.all_waypoints_complete()
+                    self.state_machine.fire(NavEvent.MISSION_COMPLETE)
                     break
 
                 wp_index = hole.index
-                # Waypoints are 1-indexed in PathPlanner (CSV row numbering)
-                wp_pose = self.path_planner.waypoints[wp_index + 1]  # Get navigation target
-                logger.info(f"========== Navigating to hole {wp_index} (waypoint {wp_index + 1}) ==========")
+                wp_pose = self._wp_targets[wp_index]  # Get navigation target
+                logger.info(
+                    "========== Navigating to hole %d (waypoint %d) ==========",
+                    wp_index,
+                    wp_index + 1,
+                )
 
                 # Mark hole as in progress
                 self.blast_pattern.mark_in_progress(wp_index)
 
                 # State: PLANNING
-                self.state_machine.waypoint_planned()
+                self.state_machine.fire(NavEvent.GOAL_SET)
 
                 # Check for row-end maneuver (echelon transition)
-                if self.blast_pattern.is_echelon_end(wp_index):
+                if self._is_echelon_end[wp_index]:
                     logger.info("Echelon end detected, executing U-turn maneuver")
                     await self._execute_row_end_maneuver()
                     self.blast_pattern.mark_completed(wp_index)  # Mark as completed after U-turn
                     continue
 
-                # Plan approach segment (stop before waypoint for vision)
-                approach_track = await self.path_planner.plan_approach_segment(
-                    wp_pose,
-                    offset_m=self.config.navigation.approach_offset_m,
-                )
+                # Plan approach segment (stop before waypoint for vision);
+                # usually already planned while the previous hole's module ran
+                approach_track, approach_start = await self._take_approach_track(wp_index, wp_pose)
 
                 # State: APPROACHING
-                self.state_machine.search_zone_reached()
+                self.state_machine.fire(NavEvent.APPROACHING_STOP)
                 logger.info("Executing approach segment...")
-                success = await self.nav_manager.execute_track(approach_track)
+                success = await self._execute_track_with_retry(
+                    approach_track,
+                    approach_start,
+                    lambda pose: self.path_planner.plan_approach_segment(
+                        wp_pose,
+                        offset_m=self.config.navigation.approach_offset_m,
+                        current=pose,
+                    ),
+                )
 
                 if not success:
                     logger.error("Approach track failed")
-                    self.state_machine.track_failed()
-                    # TODO: Implement retry logic
+                    self.state_machine.fire(NavEvent.ENTER_RECOVERY)
                     continue
 
                 # State: DETECTING
+                # The robot holds still at the approach point, so the start pose for
+                # the final track is fetched concurrently with detection
                 hole_pose = None
                 if self.config.vision.enabled and self.vision:
                     logger.info("Detecting hole with forward camera...")
-                    hole_pose = await self.vision.detect_hole_forward(
-                        search_center=self.path_planner.get_hole_position(wp_index),
-                        search_radius_m=self.config.vision.search_radius_m,
-                        timeout_s=self.config.vision.detection_timeout_s,
+                    hole_pose, start_pose = await asyncio.gather(
+                        self.vision.detect_hole_forward(
+                            search_center=self.path_planner.get_hole_position(wp_index + 1),
+                            search_radius_m=self.config.vision.search_radius_m,
+                            timeout_s=self.config.vision.detection_timeout_s,
+                        ),
+                        self.path_planner.get_current_pose(),
                     )
+                else:
+                    start_pose = await self.path_planner.get_current_pose()
 
                 if hole_pose:
                     logger.info("Hole detected by vision, using refined position")
-                    self.state_machine.hole_detected()
+                    self.state_machine.fire(NavEvent.HOLE_DETECTED)
                     final_target = hole_pose
                 else:
                     logger.info("Using CSV waypoint position (vision disabled or failed)")
-                    self.state_machine.hole_not_found()
+                    self.state_machine.fire(NavEvent.HOLE_NOT_FOUND)
                     final_target = wp_pose
 
                 # State: REFINING / EXECUTING
-                self.state_machine.path_refined()
+                self.state_machine.fire(NavEvent.PATH_PLOTTED)
                 logger.info("Executing final approach to hole...")
-                final_track = await self.path_planner.plan_segment(
-                    await self.path_planner.get_current_pose(), final_target
-                )
+                final_track = await self.path_planner.plan_segment(start_pose, final_target)
 
-                success = await self.nav_manager.execute_track(final_track)
+                success = await self._execute_track_with_retry(
+                    final_track,
+                    start_pose,
+                    lambda pose: self.path_planner.plan_segment(pose, final_target),
+                )
 
                 if not success:
                     logger.error("Final approach failed")
-                    self.state_machine.track_failed()
+                    self.state_machine.fire(NavEvent.ENTER_RECOVERY)
                     continue
 
                 # State: MODULE_PHASE (Execute module action at hole)
-                self.state_machine.track_complete()
-                logger.info(f"Executing module at waypoint {wp_index}...")
+                self.state_machine.fire(NavEvent.READY_FOR_MODULE)
+                logger.info("Executing module at waypoint %d...", wp_index)
 
-                # Create execution context for module
+                # Execution context for this hole (frozen, so derived from the base one)
                 current_pose = await self.path_planner.get_current_pose()
-                exec_context = ModuleContext(
+                exec_context = dataclasses.replace(
+                    self._exec_ctx,
                     hole_position=final_target,
                     robot_pose=current_pose,
                     waypoint_index=wp_index,
-                    canbus_client=self.services.canbus,
-                    filter_client=self.services.filter,
-                    vision_system=self.vision if hasattr(self, 'vision') else None,
-                    module_config=self.config.tool.dict() if hasattr(self.config.tool, 'dict') else {}
                 )
 
-                # Execute module
-                result = await self.module.execute(exec_context)
+                # Plan the next approach while the module works at this hole
+                self._prefetch_next_approach()
+
+                # Execute module; only transient failures (e.g. a missed dipbob ACK)
+                # are retried with backoff, so a dispense is never repeated
+                result = await execute_with_retry(
+                    self.module,
+                    exec_context,
+                    max_retries=self.config.navigation.error_recovery_max_retries,
+                    backoff_s=self.config.navigation.can_recovery_delay_s,
+                )
 
                 # State: UPDATING_PATTERN (Update blast pattern with module result)
                 if result.success:
-                    logger.info(f"✓ Hole {wp_index} completed successfully")
+                    logger.info("✓ Hole %d completed successfully", wp_index)
                     self.blast_pattern.mark_completed(wp_index, measurements=result.measurements)
-                    self.state_machine.tool_complete()
+                    self.state_machine.fire(NavEvent.MODULE_COMPLETE)
                 else:
-                    logger.error(f"✗ Module execution failed at hole {wp_index}: {result.error}")
+                    logger.error("✗ Module execution failed at hole %d: %s", wp_index, result.error)
                     self.blast_pattern.mark_failed(wp_index, error=result.error or "Unknown error")
-                    self.state_machine.tool_failed()
+                    self.state_machine.fire(NavEvent.ENTER_RECOVERY)
                     # TODO: Implement recovery logic (retry/skip/abort)
 
         except asyncio.CancelledError:
             logger.info("Navigation cancelled")
         except Exception as e:
-            logger.error(f"Navigation error: {e}", exc_info=True)
-            self.state_machine.abort()
+            logger.error("Navigation error: %s", e, exc_info=True)
+            self.state_machine.fire(NavEvent.ABORT)
         finally:
+            self._run_task = None
             await self.shutdown()
 
+    def request_shutdown(self) -> None:
+        """Request a graceful shutdown.
+
+        Sets the shutdown flag and cancels the running navigation loop so an
+        in-flight await (e.g. execute_track) is interrupted immediately instead
+        of finishing first. Safe to call from an event loop signal handler.
+        """
+        logger.info("Shutdown requested")
+        self.shutdown_requested = True
+        if self._run_task is not None:
+            self._run_task.cancel()
+
+    def _prefetch_next_approach(self) -> None:
+        """Start planning the approach to the next pending hole in the background.
+
+        The robot is stationary during module execution, so the approach planned
+        from the current pose is still valid when the next iteration starts.
+        """
+        # The current hole is IN_PROGRESS, so this is the hole after it
+        next_hole = self.blast_pattern.get_next_hole()
+        if next_hole is None or self._is_echelon_end[next_hole.index]:
+            return
+
+        self._next_approach = (
+            next_hole.index,
+            self._loop.create_task(self._plan_approach(self._wp_targets[next_hole.index])),
+        )
+
+    async def _plan_approach(self, wp_pose):
+        """Plan the approach segment from the current pose.
+
+        Args:
+            wp_pose: Navigation target for the hole
+
+        Returns:
+            Tuple of (approach track, pose it was planned from)
+        """
+        current = await self.path_planner.get_current_pose()
+        track = await self.path_planner.plan_approach_segment(
+            wp_pose,
+            offset_m=self.config.navigation.approach_offset_m,
+            current=current,
+        )
+        return track, current
+
+    async def _take_approach_track(self, wp_index: int, wp_pose):
+        """Get the approach track for a hole, reusing a prefetched plan if it matches.
+
+        Args:
+            wp_index: Hole index
+            wp_pose: Navigation target for the hole
+
+        Returns:
+            Tuple of (approach track, pose it was planned from)
+        """
+        prefetched, self._next_approach = self._next_approach, None
+        if prefetched is not None:
+            index, task = prefetched
+            if index == wp_index:
+                return await task
+            task.cancel()
+
+        return await self._plan_approach(wp_pose)
+
+    async def _execute_track_with_retry(self, track, planned_from, replan) -> bool:
+        """Execute a track, retrying a bounded number of times with backoff.
+
+        A failed track is re-sent as-is while the robot is still within
+        positioning accuracy of the pose it was planned from; only when the
+        robot has moved is it re-planned from the current pose.
+
+        Args:
+            track: Track to execute
+            planned_from: Pose the track was planned from
+            replan: Callable taking the current pose and returning an awaitable new track
+
+        Returns:
+            True if the track (or a retry) succeeded, False once retries are exhausted
+        """
+        nav = self.config.navigation
+        max_retries = nav.error_recovery_max_retries
+        tolerance = self.config.thresholds.positioning_accuracy_m
+
+        attempt = 0
+        while not await self.nav_manager.execute_track(track):
+            if attempt >= max_retries or self.shutdown_requested:
+                return False
+            attempt += 1
+            logger.warning("Track failed, retry %d/%d", attempt, max_retries)
+            await asyncio.sleep(nav.can_recovery_delay_s * 2 ** (attempt - 1))
+
+            current = await self.path_planner.get_current_pose()
+            moved = math.dist(
+                current.a_from_b.translation[:2], planned_from.a_from_b.translation[:2]
+            )
+            if moved > tolerance:
+                track = await replan(current)
+                planned_from = current
+
+        return True
+
     async def _execute_row_end_maneuver(self) -> None:
         """Execute 4-segment row-end turn."""
         logger.info("Executing row-end maneuver (4 segments)...")
 
-        for segment_idx in range(1, 5):
-            track = await self.path_planner.plan_row_end_maneuver()
-            if track is None:
-                break
+        # Each segment is planned from the previous segment's end pose while the
+        # previous one executes; the planner returns None (and resets) after the last
+        planner = self.path_planner
+        next_segment = self._loop.create_task(planner.plan_row_end_maneuver())
+        segment_idx = 0
+        try:
+            while (track := await next_segment) is not None:
+                segment_idx += 1
+                next_segment = self._loop.create_task(planner.plan_row_end_maneuver(chain=True))
+
+                logger.info("Row-end segment %d/4", segment_idx)
+                success = await self.nav_manager.execute_track(track)
 
-            logger.info(f"Row-end segment {segment_idx}/4")
-            success = await self.nav_manager.execute_track(track)
+                if not success:
+                    logger.error("Row-end segment %d failed", segment_idx)
+                    # TODO: Implement retry logic
+                    break
+        finally:
+            next_segment.cancel()
 
-            if not success:
-                logger.error(f"Row-end segment {segment_idx} failed")
-                # TODO: Implement retry logic
-                break
+        if track is not None:
+            # Aborted part-way; start the next row end from the first segment
+            planner.reset_row_end_maneuver()
 
         logger.info("Row-end maneuver complete")
 
@@ -305,13 +490,15 @@ class XStemNavigator:
         logger.info("Shutting down...")
         self.shutdown_requested = True
 
-        # Shutdown module
-        if self.module:
-            await self.module.shutdown()
+        # Drop any approach planned for a hole we will not reach
+        if self._next_approach is not None:
+            self._next_approach[1].cancel()
+            self._next_approach = None
 
-        # Stop navigation manager monitoring
-        if self.nav_manager:
-            await self.nav_manager.shutdown()
+        # Shut down the module, then stop navigation monitoring (reverse of setup).
+        # Shielded so a cancelled caller cannot interrupt teardown half-way;
+        # callbacks are popped as they run, so each resource is released once
+        await asyncio.shield(self._exit_stack.aclose())
 
         # TODO: Close service clients gracefully if needed
         # The EventClient instances in ServiceManager may need explicit cleanup
@@ -319,21 +506,20 @@ class XStemNavigator:
         logger.info("Shutdown complete")
 
 
-def signal_handler(navigator: XStemNavigator):
-    """Create signal handler for graceful shutdown.
-
-    Args:
-        navigator: Navigator instance to shutdown
+def _fast_event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get uvloop's libuv-based event loop factory when it is installed.
 
     Returns:
-        Signal handler function
+        Loop factory for asyncio.Runner, or None for the default asyncio loop
     """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return None
 
-    def handler(signum, frame):
-        logger.info(f"Received signal {signum}")
-        navigator.shutdown_requested = True
-
-    return handler
+    logger.info("Using uvloop event loop")
+    return uvloop.new_event_loop
 
 
 async def main(config_path: Path) -> None:
@@ -342,19 +528,32 @@ async def main(config_path: Path) -> None:
     Args:
         config_path: Path to configuration YAML file
     """
+    loop = asyncio.get_running_loop()
+
+    # Let tasks whose coroutines finish without blocking complete inline (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     # Load configuration
     config = XStemConfig.from_yaml(config_path)
-    logger.info(f"Loaded configuration from {config_path}")
+    logger.info("Loaded configuration from %s", config_path)
 
     # Create navigator
     navigator = XStemNavigator(config)
 
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler(navigator))
-    signal.signal(signal.SIGTERM, signal_handler(navigator))
+    try:
+        await navigator.setup()
+    except BaseException:
+        # Release whatever setup() brought up before failing (e.g. the monitor task)
+        await navigator.shutdown()
+        raise
+
+    # Signal handlers run on the event loop (woken via the signal wakeup fd),
+    # so a signal interrupts the current await instead of waiting for it
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, navigator.request_shutdown)
 
     # Run
-    await navigator.setup()
     await navigator.run()
 
 
@@ -369,9 +568,10 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     try:
-        asyncio.run(main(args.config))
+        with asyncio.Runner(loop_factory=_fast_event_loop_factory()) as runner:
+            runner.run(main(args.config))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
@@ -1,18 +1,36 @@
 """Base module interface for all tool modules."""
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import asyncio
+import functools
+import inspect
+import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Literal,
+    Mapping,
+    Optional,
+    Protocol,
+    get_type_hints,
+    runtime_checkable,
+)
 
 if TYPE_CHECKING:
     from farm_ng.core.event_client import EventClient
     from farm_ng_core_pybind import Pose3F64
 
     from amiga_platform.vision.vision_system import VisionSystem
+    from modules.can_dispatcher import CanDispatcher
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ModuleResult:
     """Result of module execution at a hole.
 
@@ -22,6 +40,10 @@ class ModuleResult:
         measurements: Optional measurement data from module (e.g., {"depth_cm": 45})
         telemetry: Optional telemetry data (e.g., {"dispense_time_s": 0.52})
         hole_completed: Whether to mark hole as completed in blast pattern
+        error_kind: Failure class: "transient" (safe to retry, e.g. timeout)
+            or "permanent" (must not be retried, e.g. misalignment or a
+            failure after material was dispensed); untagged failures are
+            not retried either
     """
 
     success: bool
@@ -29,9 +51,15 @@ class ModuleResult:
     measurements: Optional[Dict[str, Any]] = None
     telemetry: Optional[Dict[str, Any]] = None
     hole_completed: bool = True
+    error_kind: Optional[Literal["transient", "permanent"]] = None
+
+    OK: ClassVar[ModuleResult]  # Shared plain-success result, set below
+
 
+ModuleResult.OK = ModuleResult(success=True, hole_completed=True)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ModuleContext:
     """Context provided by platform to modules during execution.
 
@@ -46,6 +74,7 @@ class ModuleContext:
         filter_client: EventClient for filter/localization service
         vision_system: Vision system for alignment checks (optional)
         module_config: Module-specific configuration dictionary
+        can_dispatcher: Shared CAN receive dispatcher (optional)
     """
 
     hole_position: Pose3F64
@@ -55,13 +84,48 @@ class ModuleContext:
     filter_client: EventClient
     vision_system: Optional[VisionSystem]
     module_config: Dict[str, Any]
+    can_dispatcher: Optional[CanDispatcher] = None
+
+    @classmethod
+    def hints(cls) -> Mapping[str, Any]:
+        """Get the resolved field types, for config validators and introspection.
+
+        Use this instead of typing.get_type_hints(ModuleContext): the
+        annotations are strings naming TYPE_CHECKING-only imports, which
+        are imported and resolved once, then cached.
+
+        Returns:
+            Read-only mapping of field name to resolved type
+        """
+        return _resolve_hints(cls)
+
 
+@functools.cache
+def _resolve_hints(cls: type) -> Mapping[str, Any]:
+    """Resolve a class's string annotations once, including TYPE_CHECKING-only names."""
+    from farm_ng.core.event_client import EventClient
+    from farm_ng_core_pybind import Pose3F64
+
+    from amiga_platform.vision.vision_system import VisionSystem
+    from modules.can_dispatcher import CanDispatcher
+
+    localns = {
+        "EventClient": EventClient,
+        "Pose3F64": Pose3F64,
+        "VisionSystem": VisionSystem,
+        "CanDispatcher": CanDispatcher,
+    }
+    return MappingProxyType(get_type_hints(cls, localns=localns))
 
-class BaseModule(ABC):
-    """Abstract base class for all modules.
+
+@runtime_checkable
+class BaseModule(Protocol):
+    """Interface for all modules.
 
     All modules must implement this interface to be compatible with
-    the base platform. The platform will call these methods in order:
+    the base platform. Modules may subclass BaseModule (to inherit the
+    execute_sync() default) or just provide the same members. The
+    platform will call these methods in order:
 
     1. initialize() - Once at startup
     2. verify_ready() - Before first waypoint
@@ -72,9 +136,7 @@ class BaseModule(ABC):
     Example Implementation:
         ```python
         class MyModule(BaseModule):
-            @property
-            def module_name(self) -> str:
-                return "my_module"
+            module_name = "my_module"
 
             async def initialize(self, context: ModuleContext) -> None:
                 self.canbus = context.canbus_client
@@ -103,19 +165,25 @@ class BaseModule(ABC):
         ```
     """
 
-    @property
-    @abstractmethod
-    def module_name(self) -> str:
-        """Unique module identifier.
+    __slots__ = ()  # Lets implementations use __slots__
 
-        This should match the module_name in mission_config.yaml.
+    module_name: ClassVar[str]
+    """Unique module identifier (e.g., "xstem", "xprime").
 
-        Returns:
-            Module name (e.g., "xstem", "xprime")
-        """
-        pass
+    Set as a class attribute so the registry can read it without creating an
+    instance. This should match the module_name in mission_config.yaml.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that every concrete module defines a string module_name."""
+        super().__init_subclass__(**kwargs)
+        if "module_name" in cls.__dict__ and not isinstance(cls.__dict__["module_name"], str):
+            raise TypeError(f"{cls.__name__}.module_name must be a str")
+        if getattr(cls, "_is_protocol", False) or inspect.isabstract(cls):
+            return  # Sub-interfaces and abstract bases may leave it to their subclasses
+        if not isinstance(getattr(cls, "module_name", None), str):
+            raise TypeError(f"{cls.__name__} must define a module_name class attribute")
 
-    @abstractmethod
     async def initialize(self, context: ModuleContext) -> None:
         """Initialize module with platform-provided context.
 
@@ -133,7 +201,6 @@ class BaseModule(ABC):
         """
         pass
 
-    @abstractmethod
     async def verify_ready(self) -> bool:
         """Check if module is ready for operation.
 
@@ -148,7 +215,6 @@ class BaseModule(ABC):
         """
         pass
 
-    @abstractmethod
     async def calibrate(self) -> bool:
         """Perform module calibration routine.
 
@@ -163,7 +229,6 @@ class BaseModule(ABC):
         """
         pass
 
-    @abstractmethod
     async def execute(self, context: ModuleContext) -> ModuleResult:
         """Execute module operation at hole.
 
@@ -181,7 +246,21 @@ class BaseModule(ABC):
         """
         pass
 
-    @abstractmethod
+    def execute_sync(self, context: ModuleContext) -> Optional[ModuleResult]:
+        """Optional synchronous fast path for execute().
+
+        The platform calls this first at each hole and only awaits execute()
+        when it returns None. Modules whose operation completes without
+        awaiting anything can override it to skip the coroutine round trip.
+
+        Args:
+            context: Execution context with hole position and services
+
+        Returns:
+            ModuleResult if the operation completed synchronously, else None
+        """
+        return None
+
     async def shutdown(self) -> None:
         """Clean shutdown of module.
 
@@ -196,6 +275,24 @@ class BaseModule(ABC):
         pass
 
 
+# Methods a module class must provide (checked at registration)
+MODULE_METHODS = ("initialize", "verify_ready", "calibrate", "execute", "shutdown")
+
+
+def is_module_class(obj: Any) -> bool:
+    """Check whether obj is a class that structurally implements BaseModule.
+
+    Args:
+        obj: Object to check
+
+    Returns:
+        True if obj is a class providing every lifecycle method
+    """
+    if not isinstance(obj, type) or obj is BaseModule:
+        return False
+    return all(callable(getattr(obj, name, None)) for name in MODULE_METHODS)
+
+
 class NullModule(BaseModule):
     """Null module that does nothing.
 
@@ -203,10 +300,7 @@ class NullModule(BaseModule):
     Allows testing navigation without tool deployment.
     """
 
-    @property
-    def module_name(self) -> str:
-        """Return module name."""
-        return "none"
+    module_name = "none"
 
     async def initialize(self, context: ModuleContext) -> None:
         """Initialize null module (no-op)."""
@@ -225,8 +319,53 @@ class NullModule(BaseModule):
 
         Returns success immediately without doing anything.
         """
-        return ModuleResult(success=True, hole_completed=True)
+        return ModuleResult.OK
+
+    def execute_sync(self, context: ModuleContext) -> ModuleResult:
+        """Execute null operation without a coroutine (no-op)."""
+        return ModuleResult.OK
 
     async def shutdown(self) -> None:
         """Shutdown null module (no-op)."""
         pass
+
+
+async def execute_with_retry(
+    module: BaseModule,
+    context: ModuleContext,
+    max_retries: int = 2,
+    backoff_s: float = 0.1,
+) -> ModuleResult:
+    """Execute a module at a hole, retrying failures that may be transient.
+
+    Uses the module's execute_sync() fast path, if it has one and it
+    returns a result.
+    Only failures tagged error_kind="transient" are retried, with exponential
+    backoff (backoff_s, 2 * backoff_s, ...); any other failure is returned
+    immediately, since re-running a module may repeat a physical action.
+
+    Args:
+        module: Module to execute
+        context: Execution context for the hole
+        max_retries: Maximum number of retry attempts
+        backoff_s: Delay before the first retry in seconds
+
+    Returns:
+        Result of the last attempt
+    """
+    # Optional: modules that only provide MODULE_METHODS have no fast path
+    execute_sync = getattr(module, "execute_sync", None)
+    attempt = 0
+    while True:
+        result = execute_sync(context) if execute_sync is not None else None
+        if result is None:
+            result = await module.execute(context)
+
+        if result.success or result.error_kind != "transient" or attempt >= max_retries:
+            return result
+
+        attempt += 1
+        logger.warning(
+            "Module execution failed (%s), retry %d/%d", result.error, attempt, max_retries
+        )
+        await asyncio.sleep(backoff_s * 2 ** (attempt - 1))
@@ -0,0 +1,111 @@
+"""Shared CAN receive dispatcher for modules."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from farm_ng.core.event_service_pb2 import SubscribeRequest
+from farm_ng.core.uri_pb2 import Uri
+
+from amiga_platform.hardware.filter_utils import CAN_EFF_MASK
+
+if TYPE_CHECKING:
+    from farm_ng.canbus.canbus_pb2 import RawCanbusMessage
+    from farm_ng.core.event_client import EventClient
+
+logger = logging.getLogger(__name__)
+
+CanHandler = Callable[["RawCanbusMessage"], None]
+
+
+class CanDispatcher:
+    """Reads the CAN bus stream once and fans frames out by arbitration ID.
+
+    Modules register handlers for the IDs they care about instead of each
+    opening its own subscription. The stream is opened when the first
+    handler is registered, so missions whose modules never listen to CAN
+    do not subscribe at all.
+
+    Handlers are plain callables run inline for every matching frame; they
+    must not block (hand work off to a future or task instead).
+
+    Example Usage:
+        ```python
+        dispatcher = CanDispatcher(canbus_client)
+        dispatcher.register(0x18FF0007, on_ack)
+        ...
+        await dispatcher.stop()
+        ```
+    """
+
+    def __init__(self, canbus_client: EventClient) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            canbus_client: CAN bus service client
+        """
+        self.canbus = canbus_client
+        self._handlers: Dict[int, List[CanHandler]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, arb_id: int, handler: CanHandler) -> None:
+        """Register a handler for frames with the given arbitration ID.
+
+        Starts the receive stream if it is not running yet.
+
+        Args:
+            arb_id: 29-bit (or 11-bit) arbitration ID, without the EFF flag
+            handler: Callable invoked with each matching RawCanbusMessage
+        """
+        self._handlers.setdefault(arb_id & CAN_EFF_MASK, []).append(handler)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    def unregister(self, arb_id: int, handler: CanHandler) -> None:
+        """Remove a previously registered handler.
+
+        Args:
+            arb_id: Arbitration ID the handler was registered for
+            handler: Handler to remove
+        """
+        handlers = self._handlers.get(arb_id & CAN_EFF_MASK)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[arb_id & CAN_EFF_MASK]
+
+    async def run(self) -> None:
+        """Receive CAN frames and dispatch them until cancelled."""
+        request = SubscribeRequest(
+            uri=Uri(path="/raw_messages", query="service_name=canbus"), every_n=1
+        )
+        handlers = self._handlers
+        try:
+            async for _, msg in self.canbus.subscribe(request, decode=True):
+                # Drain the whole batch in one pass
+                for frame in msg.messages:
+                    for handler in handlers.get(frame.id & CAN_EFF_MASK, ()):
+                        try:
+                            handler(frame)
+                        except Exception as e:
+                            logger.error(
+                                "CAN handler failed for ID %#x: %s",
+                                frame.id & CAN_EFF_MASK,
+                                e,
+                                exc_info=True,
+                            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("CAN receive stream failed: %s", e, exc_info=True)
+
+    async def stop(self) -> None:
+        """Stop the receive stream."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
@@ -1,15 +1,114 @@
 """Module registry for discovering and loading modules."""
 from __future__ import annotations
 
+import hashlib
+import importlib
+import importlib.util
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Type
+from types import ModuleType
+from typing import Dict, Type, Union
 
-from .base_module import BaseModule, NullModule
+from .base_module import BaseModule, NullModule, is_module_class
 
 logger = logging.getLogger(__name__)
 
 
+def _default_cache_dir() -> Path:
+    """Per-user cache directory for discovery manifests ($XDG_CACHE_HOME/xplatform)."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "xplatform"
+
+
+def _discovery_cache_file(modules_dir: Path, cache_dir: Path) -> Path:
+    """Manifest file for one modules directory, keyed by its resolved path."""
+    digest = hashlib.sha1(str(modules_dir.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / f"discovery-{digest}.json"
+
+
+def _load_module_file(module_file: Path) -> ModuleType:
+    """Execute a plugin file (modules_dir/<name>/module.py) as a module.
+
+    Loaded by file location, so modules_dir does not have to be an
+    importable package.
+
+    Args:
+        module_file: Path to the plugin's module.py
+
+    Returns:
+        The executed module
+
+    Raises:
+        ImportError: If no loader can be created for the file
+    """
+    spec = importlib.util.spec_from_file_location(
+        f"modules.{module_file.parent.name}.module",
+        module_file
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load module file {module_file}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _import_target(target: str) -> Type[BaseModule]:
+    """Import a module class from a "package.module:ClassName" target.
+
+    The module part may also be the path of a .py file, which is loaded by
+    file location (used for classes found by discover_modules()).
+
+    Args:
+        target: Dotted module path or file path, and class name, separated by a colon
+
+    Returns:
+        The imported module class
+    """
+    module_path, _, class_name = target.rpartition(":")
+    if module_path.endswith(".py"):
+        return getattr(_load_module_file(Path(module_path)), class_name)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _find_module_class(module: ModuleType, module_name: str | None = None) -> Type[BaseModule] | None:
+    """Find the module class a plugin file provides.
+
+    Reads the file's MODULE_CLASS attribute; only files without one are
+    scanned for a class implementing BaseModule.
+
+    Args:
+        module: Imported plugin module (modules/<name>/module.py)
+        module_name: If given, only accept a class with this module_name
+
+    Returns:
+        Module class, or None if none was found
+    """
+    candidates = (getattr(module, "MODULE_CLASS", None),)
+    if candidates[0] is None:
+        # Only classes defined in this file, not ones it imports (e.g. NullModule)
+        candidates = (
+            attr for attr in vars(module).values()
+            if getattr(attr, "__module__", None) == module.__name__
+        )
+
+    for attr in candidates:
+        if is_module_class(attr) and (
+            module_name is None or getattr(attr, "module_name", None) == module_name
+        ):
+            return attr
+    return None
+
+
+def _load_discovery_cache(cache_file: Path) -> dict:
+    """Load the discovery manifest, or an empty one if missing or unreadable."""
+    try:
+        with open(cache_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
 class ModuleRegistry:
     """Registry for discovering and loading modules.
 
@@ -23,15 +122,26 @@ class ModuleRegistry:
         # Manual registration
         registry.register(MyModule)
 
+        # Lazy registration (imported on first get())
+        registry.register_lazy("my_module", "modules.my_module.module:MyModule")
+
         # Get module class and instantiate
         ModuleClass = registry.get("my_module")
         module = ModuleClass()
+
+        # Or reuse one shared instance per name
+        module = registry.get_instance("my_module")
         ```
     """
 
     def __init__(self) -> None:
         """Initialize empty registry."""
-        self._modules: Dict[str, Type[BaseModule]] = {}
+        # Values are module classes, or "package.module:ClassName" targets
+        # that are imported on first get()
+        self._modules: Dict[str, Union[Type[BaseModule], str]] = {}
+
+        # Shared instances created by get_instance(), keyed by module name
+        self._instances: Dict[str, BaseModule] = {}
 
         # Register built-in null module
         self.register(NullModule)
@@ -42,27 +152,18 @@ class ModuleRegistry:
         """Register a module class.
 
         Args:
-            module_class: Module class that implements BaseModule
+            module_class: Module class that implements the BaseModule interface
 
         Raises:
-            ValueError: If module_name is already registered
+            ValueError: If module_class doesn't define module_name
             TypeError: If module_class doesn't implement BaseModule
         """
-        if not issubclass(module_class, BaseModule):
+        if not is_module_class(module_class):
             raise TypeError(
-                f"{module_class.__name__} must inherit from BaseModule"
+                f"{getattr(module_class, '__name__', module_class)} must implement BaseModule"
             )
 
-        # Get module name from class property
-        # We need to instantiate briefly to get the name
-        # (property can't be accessed on class)
-        try:
-            temp_instance = module_class.__new__(module_class)
-            module_name = temp_instance.module_name
-        except Exception as e:
-            raise ValueError(
-                f"Could not get module_name from {module_class.__name__}: {e}"
-            )
+        module_name = self._get_module_name(module_class)
 
         if module_name in self._modules:
             logger.warning(
@@ -70,8 +171,52 @@ class ModuleRegistry:
             )
 
         self._modules[module_name] = module_class
+        self._instances.pop(module_name, None)  # Drop any instance of the old class
         logger.info(f"Registered module: {module_name} ({module_class.__name__})")
 
+    def register_lazy(self, module_name: str, target: str) -> None:
+        """Register a module by import path without importing it.
+
+        The class is imported on the first get() for module_name, so a
+        module's dependencies are only loaded when a mission uses it.
+
+        Args:
+            module_name: Registry name of the module
+            target: Import target as "package.module:ClassName"
+
+        Raises:
+            ValueError: If target is not in "package.module:ClassName" form
+        """
+        module_path, sep, class_name = target.partition(":")
+        if not (module_path and sep and class_name):
+            raise ValueError(
+                f"Invalid module target '{target}', expected 'package.module:ClassName'"
+            )
+
+        if isinstance(self._modules.get(module_name), type):
+            return  # Already imported and registered
+
+        self._modules[module_name] = target
+        logger.info(f"Registered module: {module_name} ({target}, lazy)")
+
+    @staticmethod
+    def _get_module_name(module_class: Type[BaseModule]) -> str:
+        """Read the module_name class attribute from a module class.
+
+        Args:
+            module_class: Module class that implements the BaseModule interface
+
+        Returns:
+            The module's registry name
+
+        Raises:
+            ValueError: If module_class doesn't define module_name
+        """
+        module_name = getattr(module_class, "module_name", None)
+        if not isinstance(module_name, str):
+            raise ValueError(f"{module_class.__name__} must define a module_name class attribute")
+        return module_name
+
     def get(self, module_name: str) -> Type[BaseModule]:
         """Get module class by name.
 
@@ -84,14 +229,77 @@ class ModuleRegistry:
         Raises:
             KeyError: If module_name not found in registry
         """
-        if module_name not in self._modules:
+        entry = self._modules.get(module_name)
+        if entry is None:
             available = ", ".join(self._modules.keys())
             raise KeyError(
                 f"Module '{module_name}' not found in registry. "
                 f"Available modules: {available}"
             )
 
-        return self._modules[module_name]
+        if isinstance(entry, str):
+            # Deferred entry: import now and keep the class for later lookups
+            entry = self._modules[module_name] = _import_target(entry)
+
+        return entry
+
+    def get_instance(self, module_name: str) -> BaseModule:
+        """Get the shared instance of a module, creating it on first use.
+
+        Repeated missions reuse the same instance; it is initialized and
+        shut down per mission by the caller as usual.
+
+        Args:
+            module_name: Name of module to retrieve
+
+        Returns:
+            Module instance
+
+        Raises:
+            KeyError: If module_name not found in registry
+        """
+        instance = self._instances.get(module_name)
+        if instance is None:
+            instance = self._instances[module_name] = self.get(module_name)()
+        return instance
+
+    def load(self, module_name: str) -> Type[BaseModule]:
+        """Load a single named module without scanning the modules directory.
+
+        Imports the modules.<name> package (which may register itself, e.g.
+        lazily); if that does not register the name, imports
+        modules.<name>.module and registers the class whose module_name
+        matches.
+
+        Args:
+            module_name: Name of module to load
+
+        Returns:
+            Module class
+
+        Raises:
+            KeyError: If no module with that name can be found
+        """
+        if module_name not in self._modules:
+            for import_path in (f"modules.{module_name}", f"modules.{module_name}.module"):
+                try:
+                    module = importlib.import_module(import_path)
+                except ModuleNotFoundError as e:
+                    if e.name != import_path:
+                        raise  # A dependency of the module is missing
+                    break
+
+                if module_name in self._modules:
+                    break
+
+                attr = _find_module_class(module, module_name)
+                if attr is not None:
+                    self.register(attr)
+
+                if module_name in self._modules:
+                    break
+
+        return self.get(module_name)
 
     def list_modules(self) -> list[str]:
         """Get list of registered module names.
@@ -101,12 +309,17 @@ class ModuleRegistry:
         """
         return list(self._modules.keys())
 
-    def discover_modules(self, modules_dir: Path) -> None:
+    def discover_modules(self, modules_dir: Path, cache_dir: Path | None = None) -> None:
         """Auto-discover modules in directory.
 
         Looks for module.py files in subdirectories of modules_dir
         and attempts to import and register them.
 
+        Results are cached in a per-user manifest (one per modules_dir, under
+        cache_dir). A module.py whose mtime matches the manifest is not
+        executed; its class is registered by file path and only loaded when
+        get() first asks for it.
+
         Directory structure expected:
             modules_dir/
                 module1/
@@ -116,17 +329,23 @@ class ModuleRegistry:
 
         Args:
             modules_dir: Directory to search for modules
+            cache_dir: Directory for the discovery manifest
+                (default: $XDG_CACHE_HOME/xplatform)
 
         Note:
             This is a simple discovery mechanism. Modules must:
             1. Have a module.py file
-            2. Define a class that inherits from BaseModule
-            3. The class name should end with "Module" (convention)
+            2. Define a class that implements BaseModule
+            3. Expose it as MODULE_CLASS (otherwise the file is scanned for one)
+            4. The class name should end with "Module" (convention)
         """
         if not modules_dir.exists():
             logger.warning(f"Modules directory does not exist: {modules_dir}")
             return
 
+        cache_file = _discovery_cache_file(modules_dir, cache_dir or _default_cache_dir())
+        cache = _load_discovery_cache(cache_file)
+        new_cache = {}
         discovered_count = 0
 
         for module_path in modules_dir.iterdir():
@@ -140,30 +359,33 @@ class ModuleRegistry:
             if not module_file.exists():
                 continue
 
-            # Try to import the module
+            # Warm cache: register the file target without executing module.py
             module_name = module_path.name
+            mtime_ns = module_file.stat().st_mtime_ns
+            cached = cache.get(module_name)
+            if cached and cached.get("mtime_ns") == mtime_ns:
+                if cached["module_name"] not in self._modules:
+                    self._modules[cached["module_name"]] = (
+                        f"{module_file.resolve()}:{cached['class_name']}"
+                    )
+                new_cache[module_name] = cached
+                discovered_count += 1
+                continue
+
+            # Try to import the module
             try:
-                # Dynamic import
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    f"modules.{module_name}.module",
-                    module_file
-                )
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
-                    # Find BaseModule subclass in module
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (
-                            isinstance(attr, type)
-                            and issubclass(attr, BaseModule)
-                            and attr is not BaseModule
-                        ):
-                            self.register(attr)
-                            discovered_count += 1
-                            break
+                module = _load_module_file(module_file)
+
+                # Find BaseModule implementation in module
+                attr = _find_module_class(module)
+                if attr is not None:
+                    self.register(attr)
+                    discovered_count += 1
+                    new_cache[module_name] = {
+                        "mtime_ns": mtime_ns,
+                        "module_name": self._get_module_name(attr),
+                        "class_name": attr.__name__,
+                    }
 
             except Exception as e:
                 logger.error(
@@ -171,6 +393,14 @@ class ModuleRegistry:
                     exc_info=True
                 )
 
+        if new_cache != cache:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, "w") as f:
+                    json.dump(new_cache, f, indent=2)
+            except OSError as e:
+                logger.debug(f"Could not write discovery cache {cache_file}: {e}")
+
         logger.info(f"Discovered {discovered_count} module(s)")
 
 
@@ -198,6 +428,32 @@ def register_module(module_class: Type[BaseModule]) -> None:
     _global_registry.register(module_class)
 
 
+def register_lazy(module_name: str, target: str) -> None:
+    """Register a module by import path in the global registry.
+
+    Convenience function for lazy registration.
+
+    Args:
+        module_name: Registry name of the module
+        target: Import target as "package.module:ClassName"
+    """
+    _global_registry.register_lazy(module_name, target)
+
+
+def get_module_instance(module_name: str) -> BaseModule:
+    """Get the shared module instance from the global registry.
+
+    Convenience function for getting module instances.
+
+    Args:
+        module_name: Name of module to get
+
+    Returns:
+        Module instance
+    """
+    return _global_registry.get_instance(module_name)
+
+
 def get_module(module_name: str) -> Type[BaseModule]:
     """Get module class from global registry.
 
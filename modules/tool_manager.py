@@ -1,10 +1,11 @@
 """Abstract tool interface for swappable tool modules."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from farm_ng_core_pybind import Pose3F64
@@ -14,11 +15,17 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ToolResult:
-    """Tool deployment result."""
+    """Tool deployment result.
+
+    error_kind classifies a failure: "transient" (e.g. a timeout) is safe to
+    retry, "permanent" (e.g. misalignment) fails the same way every time.
+    Untagged failures are not retried.
+    """
 
     success: bool
     error: str | None = None
     measurement: dict | None = None
+    error_kind: Literal["transient", "permanent"] | None = None
 
 
 class ToolModule(ABC):
@@ -63,19 +70,24 @@ class ToolManager:
         self.module = module
 
     async def execute_deployment(
-        self, hole_position: Pose3F64, max_retries: int = 2
+        self, hole_position: Pose3F64, max_retries: int = 2, backoff_s: float = 0.1
     ) -> bool:
         """Execute tool module with retry logic.
 
+        Only transient failures are retried, with exponential backoff
+        (backoff_s, 2 * backoff_s, ...).
+
         Args:
             hole_position: Target hole position
             max_retries: Maximum number of retry attempts
+            backoff_s: Delay before the first retry in seconds
 
         Returns:
             True if deployment succeeded
         """
         for attempt in range(max_retries + 1):
             if attempt > 0:
+                await asyncio.sleep(backoff_s * 2 ** (attempt - 1))
                 logger.warning(f"Retrying tool deployment (attempt {attempt + 1})")
 
             result = await self.module.execute(hole_position)
@@ -91,5 +103,9 @@ class ToolManager:
                 f"{result.error}"
             )
 
+            if result.error_kind != "transient":
+                logger.error("Tool deployment failed permanently, not retrying")
+                return False
+
         logger.error("Tool deployment failed after all retries")
         return False
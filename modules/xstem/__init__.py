@@ -1,8 +1,16 @@
 """XStem stemming module implementation."""
-from .module import StemmingModule
+from modules.registry import register_lazy
 
-# Auto-register module
-from modules.registry import register_module
-register_module(StemmingModule)
+# Register by import path; .module (and its hardware deps) loads on first use
+register_lazy("xstem", "modules.xstem.module:StemmingModule")
 
 __all__ = ["StemmingModule"]
+
+
+def __getattr__(name):
+    """Import StemmingModule on first attribute access."""
+    if name == "StemmingModule":
+        from .module import StemmingModule
+
+        return StemmingModule
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
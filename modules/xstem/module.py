@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from amiga_platform.hardware.filter_utils import trigger_dipbob
-from amiga_platform.hardware.actuator import CanHBridgeActuator, NullActuator
+from amiga_platform.hardware.filter_utils import (
+    DIPBOB_ARB_ID,
+    dispatch_can_frame,
+    trigger_dipbob,
+)
 
 from modules.base_module import BaseModule, ModuleContext, ModuleResult
+from modules.can_dispatcher import CanDispatcher
 
 if TYPE_CHECKING:
     from farm_ng.core.event_client import EventClient
@@ -19,6 +25,58 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class StemmingParams:
+    """Stemming parameters parsed once from the module config.
+
+    Attributes:
+        dipbob_tolerance_m: Alignment tolerance for the dipbob
+        chute_tolerance_m: Alignment tolerance for the chute
+        ack_timeout_s: Wait time for the dipbob measurement ACK
+        measurement_settle_s: Settle time after the measurement
+        open_s: Chute opening pulse duration
+        close_s: Chute closing pulse duration
+        rate_hz: Chute actuation control rate
+        pre_dispense_settle_s: Settle time before dispensing
+    """
+
+    dipbob_tolerance_m: float = 0.02
+    chute_tolerance_m: float = 0.02
+    ack_timeout_s: float = 5.0
+    measurement_settle_s: float = 2.0
+    open_s: float = 0.2
+    close_s: float = 0.3
+    rate_hz: float = 10.0
+    pre_dispense_settle_s: float = 2.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> StemmingParams:
+        """Build from the module config dictionary (see modules/xstem/config.yaml).
+
+        Args:
+            config: Module configuration with alignment, dipbob and chute sections
+
+        Returns:
+            Parsed parameters
+
+        Raises:
+            TypeError, ValueError: If a value cannot be converted to float
+        """
+        alignment = config.get("alignment", {})
+        dipbob = config.get("dipbob", {})
+        chute = config.get("chute", {})
+        return cls(
+            dipbob_tolerance_m=float(alignment.get("dipbob_tolerance_m", 0.02)),
+            chute_tolerance_m=float(alignment.get("chute_tolerance_m", 0.02)),
+            ack_timeout_s=float(dipbob.get("ack_timeout_s", 5.0)),
+            measurement_settle_s=float(dipbob.get("measurement_settle_s", 2.0)),
+            open_s=float(chute.get("open_duration_s", 0.2)),
+            close_s=float(chute.get("close_duration_s", 0.3)),
+            rate_hz=float(chute.get("control_rate_hz", 10.0)),
+            pre_dispense_settle_s=float(chute.get("pre_dispense_settle_s", 2.0)),
+        )
+
+
 class StemmingModule(BaseModule):
     """XStem stemming module: dipbob measurement + gravel dispensing.
 
@@ -37,6 +95,21 @@ class StemmingModule(BaseModule):
     - Vision system (optional) for alignment verification
     """
 
+    module_name = "xstem"
+
+    __slots__ = (
+        "canbus",
+        "actuator",
+        "vision",
+        "config",
+        "params",
+        "_can",
+        "_owns_can",
+        "_trigger",
+        "_pulse",
+        "_pulse_program",
+    )
+
     def __init__(self) -> None:
         """Initialize stemming module.
 
@@ -46,11 +119,14 @@ class StemmingModule(BaseModule):
         self.actuator: Optional[BaseActuator] = None
         self.vision: Optional[VisionSystem] = None
         self.config: dict = {}
+        self.params = StemmingParams()
+        self._can: Optional[CanDispatcher] = None
+        self._owns_can = False
 
-    @property
-    def module_name(self) -> str:
-        """Get module name."""
-        return "xstem"
+        # Hot-path callables, bound in initialize()
+        self._trigger = None  # trigger_dipbob bound to the CAN client
+        self._pulse = None  # actuator.run_program
+        self._pulse_program = None  # Chute pulse sequence, fixed for the mission
 
     async def initialize(self, context: ModuleContext) -> None:
         """Initialize stemming module with platform context.
@@ -64,8 +140,23 @@ class StemmingModule(BaseModule):
         self.canbus = context.canbus_client
         self.vision = context.vision_system
         self.config = context.module_config
+        self.params = StemmingParams.from_config(self.config)
+
+        # Route dipbob ACK frames to trigger_dipbob's waiters via the shared
+        # dispatcher (or a private one if the platform did not provide it)
+        self._can = context.can_dispatcher
+        self._owns_can = self._can is None
+        if self._owns_can:
+            self._can = CanDispatcher(context.canbus_client)
+        self._can.register(DIPBOB_ARB_ID, dispatch_can_frame)
+
+        # Initialize chute actuator (actuator classes imported only when a chute is set up)
+        from amiga_platform.hardware.actuator import (
+            CanHBridgeActuator,
+            NullActuator,
+            PulseProgram,
+        )
 
-        # Initialize chute actuator
         chute_config = self.config.get("chute", {})
         actuator_id = chute_config.get("actuator_id", 0)
 
@@ -74,34 +165,77 @@ class StemmingModule(BaseModule):
                 context.canbus_client,
                 actuator_id
             )
-            logger.info(f"Initialized chute actuator (ID: {actuator_id})")
+            logger.info("Initialized chute actuator (ID: %s)", actuator_id)
         else:
             self.actuator = NullActuator()
             logger.info("Using null actuator (no physical chute)")
 
+        # Bind per-hole calls once instead of resolving them on every execute()
+        self._trigger = functools.partial(trigger_dipbob, context.canbus_client)
+        self._pulse = self.actuator.run_program
+        self._pulse_program = PulseProgram.from_durations(
+            open_seconds=self.params.open_s,
+            close_seconds=self.params.close_s,
+            rate_hz=self.params.rate_hz,
+            settle_before=self.params.pre_dispense_settle_s,
+        )
+
         logger.info("XStem stemming module initialized")
 
     async def verify_ready(self) -> bool:
         """Check if stemming module is ready.
 
+        Readiness checks run concurrently, so startup waits for the slowest
+        check rather than the sum of all of them.
+
         Returns:
             True if ready for deployment
         """
-        # TODO: Add actual readiness checks
-        # - Check dipbob status via CAN
-        # - Check chute actuator status
-        # - Check gravel level sensor
-        # - Verify vision system if required
-
+        checks = {
+            "dipbob": self._check_dipbob(),
+            "actuator": self._check_actuator(),
+            "gravel": self._check_gravel(),
+            "vision": self._check_vision(),
+        }
+        results = await asyncio.gather(*checks.values(), return_exceptions=True)
+
+        ready = True
+        for name, result in zip(checks, results):
+            if isinstance(result, Exception):
+                logger.error("Readiness check '%s' raised: %s", name, result)
+                ready = False
+            elif result is not True:
+                logger.error("Readiness check '%s' failed", name)
+                ready = False
+
+        if ready:
+            logger.info("Stemming module ready")
+        return ready
+
+    async def _check_dipbob(self) -> bool:
+        """Check the dipbob can be commanded."""
+        # TODO: Query dipbob status via CAN
         if not self.canbus:
             logger.error("CAN bus not initialized")
             return False
+        return True
 
+    async def _check_actuator(self) -> bool:
+        """Check the chute actuator is set up."""
+        # TODO: Query chute actuator status
         if not self.actuator:
             logger.error("Actuator not initialized")
             return False
+        return True
+
+    async def _check_gravel(self) -> bool:
+        """Check there is gravel to dispense."""
+        # TODO: Read gravel level sensor
+        return True
 
-        logger.info("Stemming module ready")
+    async def _check_vision(self) -> bool:
+        """Check the vision system, if one is in use."""
+        # TODO: Verify downward camera stream when vision is required
         return True
 
     async def calibrate(self) -> bool:
@@ -140,96 +274,95 @@ class StemmingModule(BaseModule):
             ModuleResult with success/failure and measurements
         """
         try:
-            alignment_config = self.config.get("alignment", {})
-            dipbob_config = self.config.get("dipbob", {})
-            chute_config = self.config.get("chute", {})
+            params = self.params
 
             # Step 1: Verify dipbob alignment with downward camera
             if self.vision:
                 logger.info("Step 1: Verifying dipbob alignment...")
                 aligned = await self.vision.align_tool_downward(
-                    tolerance_m=alignment_config.get("dipbob_tolerance_m", 0.02)
+                    tolerance_m=params.dipbob_tolerance_m
                 )
 
                 if not aligned:
                     return ModuleResult(
                         success=False,
                         error="Dipbob alignment failed",
-                        hole_completed=False
+                        hole_completed=False,
+                        error_kind="permanent",
                     )
             else:
                 logger.info("Step 1: Skipping alignment (vision disabled)")
 
-            # Step 2: Deploy dipbob
-            logger.info("Step 2: Deploying dipbob...")
-            await self._trigger_dipbob()
-
-            # Step 3: Wait for measurement ACK
-            logger.info("Step 3: Waiting for dipbob measurement...")
-            ack_timeout = dipbob_config.get("ack_timeout_s", 5.0)
-            ack = await self._wait_for_dipbob_ack(timeout=ack_timeout)
+            # Step 2-3: Deploy dipbob and wait for measurement ACK
+            logger.info("Step 2-3: Deploying dipbob and waiting for measurement...")
+            ack = await self._wait_for_dipbob_ack(timeout=params.ack_timeout_s)
 
             if not ack:
                 return ModuleResult(
                     success=False,
                     error="Dipbob measurement timeout",
-                    hole_completed=False
+                    hole_completed=False,
+                    error_kind="transient",
                 )
 
             # Step 4-5: Platform handles robot movement to align chute
             # Wait for platform to complete movement
             logger.info("Step 4-5: Waiting for chute alignment (platform handles movement)...")
-            settle_time = dipbob_config.get("measurement_settle_s", 2.0)
-            await asyncio.sleep(settle_time)
+            settle = asyncio.sleep(params.measurement_settle_s)
 
-            # Optional: Verify chute alignment
+            # Optional: Verify chute alignment, overlapped with the settle wait
+            # (the wait is the floor either way; dispensing starts after both)
             if self.vision:
-                chute_aligned = await self.vision.align_tool_downward(
-                    tolerance_m=alignment_config.get("chute_tolerance_m", 0.02)
+                _, chute_aligned = await asyncio.gather(
+                    settle,
+                    self.vision.align_tool_downward(tolerance_m=params.chute_tolerance_m),
                 )
 
                 if not chute_aligned:
                     logger.warning("Chute alignment suboptimal, proceeding anyway")
+            else:
+                await settle
 
             # Step 6-7: Dispense gravel
             logger.info("Step 6-7: Dispensing gravel...")
-            await self.actuator.pulse_sequence(
-                open_seconds=chute_config.get("open_duration_s", 0.2),
-                close_seconds=chute_config.get("close_duration_s", 0.3),
-                rate_hz=chute_config.get("control_rate_hz", 10.0),
-                settle_before=chute_config.get("pre_dispense_settle_s", 2.0),
-            )
+            await self._pulse(self._pulse_program)
 
             logger.info("✓ Stemming sequence complete")
-            return ModuleResult(
-                success=True,
-                measurements={"sequence": "complete"},  # TODO: Add actual measurements
-                hole_completed=True
-            )
+            return ModuleResult.OK
 
         except Exception as e:
-            logger.error(f"✗ Stemming sequence failed: {e}", exc_info=True)
+            # Tracebacks only at DEBUG: transient CAN errors can fail many holes
+            logger.error(
+                "✗ Stemming sequence failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            # Permanent: the dipbob may have fired or gravel may be partly
+            # dispensed, so re-running the sequence could double-fill the hole
             return ModuleResult(
                 success=False,
                 error=str(e),
-                hole_completed=False
+                hole_completed=False,
+                error_kind="permanent",
             )
 
     async def shutdown(self) -> None:
         """Clean shutdown of stemming module."""
         logger.info("Shutting down stemming module...")
 
-        # No ongoing operations to stop (all operations are synchronous in execute)
+        # Stop listening for dipbob ACKs
+        if self._can:
+            self._can.unregister(DIPBOB_ARB_ID, dispatch_can_frame)
+            if self._owns_can:
+                await self._can.stop()
+
         # Actuators return to safe state automatically
 
         logger.info("Stemming module shutdown complete")
 
-    async def _trigger_dipbob(self) -> None:
-        """Trigger dipbob deployment via CAN."""
-        await trigger_dipbob(self.canbus)
-
     async def _wait_for_dipbob_ack(self, timeout: float) -> bool:
-        """Wait for dipbob measurement acknowledgement.
+        """Deploy the dipbob and wait for its measurement acknowledgement.
+
+        The ACK waiter is registered before the trigger is sent, and this
+        returns as soon as the ACK frame arrives instead of after a fixed delay.
 
         Args:
             timeout: Timeout in seconds
@@ -237,9 +370,8 @@ class StemmingModule(BaseModule):
         Returns:
             True if ACK received
         """
-        # TODO: Listen for actual CAN ACK signal
-        # For now, just wait for expected measurement time
-        logger.info(f"Waiting {timeout}s for dipbob measurement...")
-        await asyncio.sleep(timeout)
-        logger.info("Dipbob measurement complete (placeholder)")
-        return True
+        return await self._trigger(ack_timeout_s=timeout)
+
+
+# Module class picked up by ModuleRegistry discovery
+MODULE_CLASS = StemmingModule
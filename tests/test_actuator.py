@@ -0,0 +1,48 @@
+"""Test chute actuator pulse timing."""
+import asyncio
+import time
+
+from amiga_platform.hardware.actuator import CanHBridgeActuator, PulseProgram
+
+SEND_RTT_S = 0.05
+
+
+class SlowCanbus:
+    """CAN bus client whose /control_tools round trip takes SEND_RTT_S."""
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def request_reply(self, path, msg, decode=True):
+        self.sent.append(msg)
+        await asyncio.sleep(SEND_RTT_S)
+
+
+def test_pulse_stops_at_wall_clock_deadline():
+    """Test that send round trips count against the pulse duration."""
+    canbus = SlowCanbus()
+    actuator = CanHBridgeActuator(canbus, actuator_id=1)
+
+    start = time.monotonic()
+    asyncio.run(actuator.pulse_open(0.2, rate_hz=20.0))
+    elapsed = time.monotonic() - start
+
+    # 20 Hz for 0.2 s is 4 periods, but each send + sleep takes 0.1 s here
+    opens, stop = canbus.sent[:-1], canbus.sent[-1]
+    assert len(opens) == 2
+    assert all(cmd is actuator._open_cmd for cmd in opens)
+    assert stop is actuator._stop_cmd
+    assert elapsed < 0.35
+
+
+def test_run_program_opens_then_closes():
+    """Test that a precomputed program sends OPEN, STOP, CLOSE, STOP."""
+    canbus = SlowCanbus()
+    actuator = CanHBridgeActuator(canbus, actuator_id=1)
+    program = PulseProgram.from_durations(0.01, 0.01, rate_hz=10.0, settle_between=0.0)
+
+    asyncio.run(actuator.run_program(program))
+
+    assert canbus.sent == [
+        actuator._open_cmd, actuator._stop_cmd, actuator._close_cmd, actuator._stop_cmd
+    ]
@@ -1,24 +1,29 @@
 """Test blast pattern tracking functionality."""
 import tempfile
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from farm_ng_core_pybind import Isometry3F64, Pose3F64, Rotation3F64
 
 from amiga_platform.core.blast_pattern import BlastPattern, HoleStatus
 
+# Shared by every test hole; Isometry3F64 copies it, so one instance suffices
+_IDENTITY_ROT = Rotation3F64()
 
-def create_test_holes(count: int = 6) -> List[Pose3F64]:
-    """Create test hole positions."""
-    holes = []
+
+def iter_test_holes(count: int = 6) -> Iterator[Pose3F64]:
+    """Lazily yield test hole positions (for large patterns)."""
     for i in range(count):
-        position = Pose3F64(
+        yield Pose3F64(
             frame_a="world",
             frame_b=f"hole_{i}",
-            a_from_b=Isometry3F64([float(i), 0.0, 0.0], Rotation3F64()),
+            a_from_b=Isometry3F64([float(i), 0.0, 0.0], _IDENTITY_ROT),
         )
-        holes.append(position)
-    return holes
+
+
+def create_test_holes(count: int = 6) -> List[Pose3F64]:
+    """Create test hole positions."""
+    return list(iter_test_holes(count))
 
 
 def test_blast_pattern_initialization():
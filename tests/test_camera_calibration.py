@@ -0,0 +1,54 @@
+"""Test camera calibration extrinsics."""
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+from farm_ng_core_pybind import Isometry3F64, Pose3F64, Rotation3F64
+
+from amiga_platform.vision.camera_calibration import CameraCalibration
+
+MOUNT = {"offset_x": 0.5, "offset_y": 0.0, "offset_z": 1.0, "pitch_deg": 30.0}
+
+
+class FakeOak:
+    """Oak client that returns a fixed calibration."""
+
+    async def request_reply(self, path, msg, decode=True):
+        camera = SimpleNamespace(
+            intrinsic_matrix=[800.0, 0.0, 320.0, 0.0, 800.0, 240.0, 0.0, 0.0, 1.0],
+            distortion_coeff=[0.0] * 5,
+        )
+        return SimpleNamespace(camera_data=[camera])
+
+
+def _loaded(mount=MOUNT):
+    cal = CameraCalibration(FakeOak(), mount)
+    asyncio.run(cal.load_calibration())
+    return cal
+
+
+def test_camera_to_robot_matches_pose_composition():
+    """Test the cached transform against robot_from_camera * camera_from_object."""
+    cal = _loaded()
+    p_cam = np.array([0.1, -0.2, 2.0])
+
+    camera_from_object = Pose3F64(
+        a_from_b=Isometry3F64(p_cam, Rotation3F64()), frame_a="camera", frame_b="object"
+    )
+    expected = (cal.robot_from_camera * camera_from_object).a_from_b
+
+    np.testing.assert_allclose(cal.camera_to_robot_xyz(p_cam), expected.translation, atol=1e-12)
+    pose = cal.camera_to_robot(p_cam).a_from_b
+    np.testing.assert_allclose(pose.translation, expected.translation, atol=1e-12)
+    np.testing.assert_allclose(
+        pose.rotation.rotation_matrix, expected.rotation.rotation_matrix, atol=1e-12
+    )
+
+
+def test_untilted_camera_looks_forward():
+    """Test that camera +Z (DepthAI forward) maps to robot +X at zero pitch."""
+    cal = _loaded({**MOUNT, "pitch_deg": 0.0})
+
+    np.testing.assert_allclose(
+        cal.camera_to_robot_xyz((0.0, 0.0, 1.0)), (1.5, 0.0, 1.0), atol=1e-12
+    )
@@ -0,0 +1,59 @@
+"""Test CAN frame dispatch by arbitration ID."""
+import asyncio
+
+from farm_ng.canbus.canbus_pb2 import RawCanbusMessage, RawCanbusMessages
+
+from amiga_platform.hardware.filter_utils import eff_id
+from modules.can_dispatcher import CanDispatcher
+
+ID_A = 0x18FF0007
+ID_B = 0x18FF0008
+
+
+class FakeCanbus:
+    """CAN bus client whose receive stream yields the given frame batches."""
+
+    def __init__(self, *batches: list) -> None:
+        self.batches = batches
+
+    async def subscribe(self, request, decode=True):
+        for frames in self.batches:
+            yield None, RawCanbusMessages(messages=frames)
+
+
+def _frame(arb_id: int, data: bytes = b"\x00") -> RawCanbusMessage:
+    return RawCanbusMessage(id=eff_id(arb_id), data=data)
+
+
+def _run(canbus, *registrations):
+    async def _dispatch():
+        dispatcher = CanDispatcher(canbus)
+        for arb_id, handler in registrations:
+            dispatcher.register(arb_id, handler)
+        await dispatcher._task  # Stream ends after the last batch
+        await dispatcher.stop()
+
+    asyncio.run(_dispatch())
+
+
+def test_handler_receives_frames_for_its_id():
+    """Test that a handler only gets frames with its arbitration ID, in order."""
+    canbus = FakeCanbus([_frame(ID_A, b"\x01"), _frame(ID_B)], [_frame(ID_A, b"\x02")])
+    received = []
+
+    _run(canbus, (ID_A, received.append))
+
+    assert [frame.data for frame in received] == [b"\x01", b"\x02"]
+
+
+def test_failing_handler_does_not_stop_dispatch():
+    """Test that an exception in one handler is logged and others still run."""
+    canbus = FakeCanbus([_frame(ID_A), _frame(ID_A)])
+    received = []
+
+    def _fail(frame):
+        raise RuntimeError("boom")
+
+    _run(canbus, (ID_A, _fail), (ID_A, received.append))
+
+    assert len(received) == 2
@@ -0,0 +1,122 @@
+"""Test the v1 configuration dataclasses."""
+from __future__ import annotations  # String annotations, as in amiga_platform.core.config
+
+import dataclasses
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from amiga_platform.core.config import (
+    CameraConfig,
+    ServiceConfig,
+    WaypointConfig,
+    XStemConfig,
+    _build,
+    _ConfigBase,
+)
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+MODULE_CONFIG = CONFIG_DIR.parent / "modules" / "xstem" / "config.yaml"
+
+CAMERA = {
+    "service_name": "oak/1",
+    "role": "forward",
+    "model_path": "models/hole.blob",
+    "offset_x": 0.5,
+    "offset_y": 0,
+    "offset_z": 1,
+    "pitch_deg": 30,
+}
+
+
+def test_load_v1_config():
+    """Test loading config/navigation_config.yaml."""
+    config = XStemConfig.from_yaml(CONFIG_DIR / "navigation_config.yaml")
+
+    assert config.services["canbus"].port == 6001
+    assert config.waypoints.coordinate_system in ("ENU", "NWU")
+
+
+def test_load_multi_tier_config():
+    """Test loading the platform, mission and module configs together."""
+    config = XStemConfig.from_multi_tier(
+        CONFIG_DIR / "platform_config.yaml",
+        CONFIG_DIR / "mission_config.yaml",
+        MODULE_CONFIG,
+    )
+
+    assert config.tool.type == "stemming"
+    assert config.vision.downward_camera.role == "downward"
+
+
+def test_dict_round_trips():
+    """Test that dict() returns plain nested mappings the constructors accept."""
+    config = XStemConfig.from_yaml(CONFIG_DIR / "navigation_config.yaml")
+
+    data = config.dict()
+    assert isinstance(data["services"], dict)
+    assert CameraConfig(**data["vision"]["forward_camera"]) == config.vision.forward_camera
+
+
+def test_dict_excludes_derived_fields():
+    """Test that dict() leaves out init=False fields."""
+
+    @dataclasses.dataclass(frozen=True)
+    class Span(_ConfigBase):
+        start: float
+        end: float
+        length: float = dataclasses.field(init=False)
+
+        def __post_init__(self) -> None:
+            object.__setattr__(self, "length", self.end - self.start)
+
+    span = Span(start=1.0, end=3.0)
+    assert span.dict() == {"start": 1.0, "end": 3.0}
+    assert Span(**span.dict()).length == 2.0
+
+
+@pytest.mark.parametrize(
+    "cls, data",
+    [
+        (CameraConfig, {**CAMERA, "role": "sideways"}),
+        (WaypointConfig, {"csv_path": "p.csv", "last_row_waypoint_index": 3, "turn_direction": "up"}),
+        (WaypointConfig, {"csv_path": "p.csv", "last_row_waypoint_index": 3, "coordinate_system": "NED"}),
+    ],
+)
+def test_bad_choice_raises(cls, data):
+    """Test that a Literal field outside its choices raises ValueError."""
+    with pytest.raises(ValueError):
+        _build(cls, data)
+
+
+def test_scalar_coercion():
+    """Test that YAML scalars are converted to the annotated field types."""
+    service = _build(ServiceConfig, {"name": "canbus", "port": "6001", "extra": 1})
+    assert service.port == 6001
+
+    camera = _build(CameraConfig, CAMERA)
+    assert isinstance(camera.model_path, Path)
+    assert isinstance(camera.offset_z, float)
+
+
+def test_optional_coercion():
+    """Test that Optional[...] fields are coerced, and None is kept."""
+
+    @dataclasses.dataclass
+    class Limits:
+        max_speed: Optional[float] = None
+        label: Optional[str] = None
+
+    limits = _build(Limits, {"max_speed": "1.5", "label": None})
+    assert limits.max_speed == 1.5
+    assert limits.label is None
+
+
+def test_cached_config_services_read_only():
+    """Test that the shared cached config's services cannot be mutated."""
+    config = XStemConfig.from_yaml(CONFIG_DIR / "navigation_config.yaml")
+
+    with pytest.raises(TypeError):
+        config.services["canbus"] = None
+    assert XStemConfig.from_yaml(CONFIG_DIR / "navigation_config.yaml").services["canbus"].port == 6001
@@ -0,0 +1,83 @@
+"""Test dipbob trigger ACK handling."""
+import asyncio
+
+from farm_ng.canbus.canbus_pb2 import RawCanbusMessage
+
+from amiga_platform.hardware import filter_utils
+from amiga_platform.hardware.filter_utils import (
+    DIPBOB_ARB_ID,
+    dispatch_can_frame,
+    eff_id,
+    trigger_dipbob,
+)
+
+ACK_PAYLOAD = b"\x07\x00\x02\x00\x00\x00\x00\x00"
+
+
+class FakeCanbus:
+    """CAN bus client that answers each sent frame with scripted received frames."""
+
+    def __init__(self, *replies: bytes) -> None:
+        self.replies = replies
+        self.sent = []
+
+    async def request_reply(self, path, msg, decode=True):
+        self.sent.append(msg)
+        loop = asyncio.get_running_loop()
+        for data in self.replies:
+            frame = RawCanbusMessage(id=eff_id(DIPBOB_ARB_ID), data=data)
+            loop.call_soon(dispatch_can_frame, frame)
+
+
+def test_ack_resolves_trigger():
+    """Test that an ACK frame on the dipbob ID completes the trigger."""
+    canbus = FakeCanbus(ACK_PAYLOAD)
+
+    assert asyncio.run(trigger_dipbob(canbus, ack_timeout_s=1.0)) is True
+    assert len(canbus.sent) == 1
+    assert not filter_utils._ack_waiters
+
+
+def test_echo_is_not_an_ack():
+    """Test that our own trigger frame echoed back does not count as the ACK."""
+    canbus = FakeCanbus(filter_utils._DIPBOB_PAYLOAD)
+
+    assert asyncio.run(trigger_dipbob(canbus, ack_timeout_s=0.05)) is False
+    assert not filter_utils._ack_waiters
+
+
+def test_echo_then_ack():
+    """Test that the ACK following an echo still completes the trigger."""
+    canbus = FakeCanbus(filter_utils._DIPBOB_PAYLOAD, ACK_PAYLOAD)
+
+    assert asyncio.run(trigger_dipbob(canbus, ack_timeout_s=1.0)) is True
+
+
+def test_timeout_without_ack():
+    """Test that a missing ACK times out and leaves no pending waiter."""
+    canbus = FakeCanbus()
+
+    assert asyncio.run(trigger_dipbob(canbus, ack_timeout_s=0.05)) is False
+    assert not filter_utils._ack_waiters
+
+
+def test_concurrent_triggers_each_get_an_ack():
+    """Test that concurrent triggers do not overwrite each other's waiter."""
+    canbus = FakeCanbus(ACK_PAYLOAD)
+
+    async def _run():
+        return await asyncio.gather(
+            trigger_dipbob(canbus, ack_timeout_s=1.0),
+            trigger_dipbob(canbus, ack_timeout_s=1.0),
+        )
+
+    assert asyncio.run(_run()) == [True, True]
+    assert not filter_utils._ack_waiters
+
+
+def test_no_wait_without_timeout():
+    """Test that without ack_timeout_s the trigger returns once sent."""
+    canbus = FakeCanbus()
+
+    assert asyncio.run(trigger_dipbob(canbus)) is True
+    assert not filter_utils._ack_waiters
@@ -0,0 +1,143 @@
+"""Test module execution retry behaviour."""
+import abc
+import asyncio
+import inspect
+from typing import Protocol
+
+import pytest
+
+from modules.base_module import (
+    BaseModule,
+    ModuleResult,
+    NullModule,
+    execute_with_retry,
+    is_module_class,
+)
+
+
+class ScriptedModule(BaseModule):
+    """Module that returns a fixed sequence of results."""
+
+    module_name = "scripted"
+
+    def __init__(self, *results: ModuleResult) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def initialize(self, context) -> None:
+        pass
+
+    async def verify_ready(self) -> bool:
+        return True
+
+    async def calibrate(self) -> bool:
+        return True
+
+    async def execute(self, context) -> ModuleResult:
+        self.calls += 1
+        return self.results.pop(0)
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def _fail(kind):
+    return ModuleResult(success=False, error="failed", hole_completed=False, error_kind=kind)
+
+
+def test_permanent_failure_stops_retries():
+    """Test that a permanent failure is returned without retrying."""
+    module = ScriptedModule(_fail("permanent"), ModuleResult.OK)
+
+    result = asyncio.run(execute_with_retry(module, None, max_retries=3, backoff_s=0.0))
+
+    assert result.success is False
+    assert result.error_kind == "permanent"
+    assert module.calls == 1
+
+
+def test_transient_failure_is_retried():
+    """Test that a transient failure is retried until success."""
+    module = ScriptedModule(_fail("transient"), _fail("transient"), ModuleResult.OK)
+
+    result = asyncio.run(execute_with_retry(module, None, max_retries=3, backoff_s=0.0))
+
+    assert result is ModuleResult.OK
+    assert module.calls == 3
+
+
+def test_untagged_failure_is_not_retried():
+    """Test that a failure without error_kind is returned without retrying."""
+    module = ScriptedModule(_fail(None), ModuleResult.OK)
+
+    result = asyncio.run(execute_with_retry(module, None, max_retries=3, backoff_s=0.0))
+
+    assert result.success is False
+    assert module.calls == 1
+
+
+def test_retries_are_bounded():
+    """Test that retries stop after max_retries and return the last failure."""
+    module = ScriptedModule(*(_fail("transient") for _ in range(5)))
+
+    result = asyncio.run(execute_with_retry(module, None, max_retries=2, backoff_s=0.0))
+
+    assert result.success is False
+    assert module.calls == 3
+
+
+def test_sync_fast_path():
+    """Test that a module's execute_sync() result is used directly."""
+    result = asyncio.run(execute_with_retry(NullModule(), None))
+
+    assert result is ModuleResult.OK
+
+
+def test_duck_typed_module_without_execute_sync():
+    """Test that a module providing only MODULE_METHODS (no subclassing) runs."""
+
+    class DuckModule:
+        module_name = "duck"
+
+        async def initialize(self, context) -> None:
+            pass
+
+        async def verify_ready(self) -> bool:
+            return True
+
+        async def calibrate(self) -> bool:
+            return True
+
+        async def execute(self, context) -> ModuleResult:
+            return ModuleResult.OK
+
+        async def shutdown(self) -> None:
+            pass
+
+    assert is_module_class(DuckModule)
+    assert asyncio.run(execute_with_retry(DuckModule(), None)) is ModuleResult.OK
+
+
+def test_concrete_module_requires_module_name():
+    """Test that a concrete module without module_name fails at class creation."""
+    with pytest.raises(TypeError):
+
+        class UnnamedModule(BaseModule):
+            async def execute(self, context) -> ModuleResult:
+                return ModuleResult.OK
+
+
+def test_abstract_module_may_omit_module_name():
+    """Test that abstract bases and sub-protocols need no module_name."""
+
+    class AbstractModule(BaseModule):
+        @abc.abstractmethod
+        def configure(self) -> None:
+            """Configure the tool."""
+
+    class ModuleProtocol(BaseModule, Protocol):
+        def configure(self) -> None:
+            """Configure the tool."""
+
+    assert inspect.isabstract(AbstractModule)
+    assert ModuleProtocol._is_protocol
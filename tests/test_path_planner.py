@@ -0,0 +1,46 @@
+"""Test waypoint loading and robot target generation."""
+import numpy as np
+
+from amiga_platform.core.config import ToolConfig, WaypointConfig
+from amiga_platform.navigation.path_planner import PathPlanner
+
+# ENU offsets: three holes heading north, then one heading west
+CSV = "dx,dy,yaw_deg\n0.0,0.0,90\n0.0,2.0,90\n0.0,4.0,90\n-3.0,4.0,180\n"
+
+
+def _planner(tmp_path, offset_x=0.25):
+    csv_path = tmp_path / "holes.csv"
+    csv_path.write_text(CSV)
+    return PathPlanner(
+        WaypointConfig(csv_path=csv_path, last_row_waypoint_index=3),
+        ToolConfig(offset_x=offset_x),
+        filter_client=None,
+    )
+
+
+def test_robot_targets_put_tool_over_hole(tmp_path):
+    """Test that each robot target composes its hole pose with the tool offset."""
+    planner = _planner(tmp_path)
+
+    assert sorted(planner.waypoints) == [1, 2, 3, 4]
+    for idx, hole in planner.hole_poses.items():
+        world_from_hole = hole.a_from_b
+        expected = world_from_hole * planner.transforms.robot_from_tool.inverse().a_from_b
+        target = planner.waypoints[idx].a_from_b
+
+        np.testing.assert_allclose(target.translation, expected.translation, atol=1e-9)
+        np.testing.assert_allclose(
+            target.rotation.rotation_matrix, world_from_hole.rotation.rotation_matrix
+        )
+
+
+def test_robot_target_backs_off_along_heading(tmp_path):
+    """Test that a forward tool offset puts the robot behind the hole."""
+    planner = _planner(tmp_path, offset_x=0.5)
+
+    # Hole 2 is 2 m north (NWU x) with yaw 90° in the CSV
+    hole = planner.hole_poses[2].a_from_b
+    target = planner.waypoints[2].a_from_b
+    heading = hole.rotation.rotation_matrix @ (1.0, 0.0, 0.0)
+
+    np.testing.assert_allclose(target.translation, hole.translation - 0.5 * heading, atol=1e-9)
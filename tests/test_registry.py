@@ -0,0 +1,79 @@
+"""Test module discovery and its warm cache."""
+import os
+
+from modules.registry import ModuleRegistry
+
+PLUGIN_SOURCE = '''
+from modules.base_module import BaseModule, ModuleResult
+
+
+class {cls}(BaseModule):
+    module_name = "{name}"
+
+    async def initialize(self, context):
+        pass
+
+    async def verify_ready(self):
+        return True
+
+    async def calibrate(self):
+        return True
+
+    async def execute(self, context):
+        return ModuleResult.OK
+
+    async def shutdown(self):
+        pass
+'''
+
+
+def _write_plugin(modules_dir, name, cls):
+    plugin_dir = modules_dir / name
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    module_file = plugin_dir / "module.py"
+    module_file.write_text(PLUGIN_SOURCE.format(cls=cls, name=name))
+    return module_file
+
+
+def test_cold_discovery_registers_class(tmp_path):
+    """Test that a first scan executes module.py and registers its class."""
+    modules_dir = tmp_path / "plugins"
+    _write_plugin(modules_dir, "probe", "ProbeModule")
+
+    registry = ModuleRegistry()
+    registry.discover_modules(modules_dir, cache_dir=tmp_path / "cache")
+
+    assert registry._modules["probe"].__name__ == "ProbeModule"
+    assert list((tmp_path / "cache").iterdir())
+    assert not (modules_dir / ".discovery_cache.json").exists()
+
+
+def test_warm_cache_loads_lazily_from_non_package_dir(tmp_path):
+    """Test that a warm hit defers loading and works outside the modules package."""
+    modules_dir = tmp_path / "plugins"  # No __init__.py: not importable as a package
+    _write_plugin(modules_dir, "probe", "ProbeModule")
+    ModuleRegistry().discover_modules(modules_dir, cache_dir=tmp_path / "cache")
+
+    registry = ModuleRegistry()
+    registry.discover_modules(modules_dir, cache_dir=tmp_path / "cache")
+
+    assert isinstance(registry._modules["probe"], str)  # Not executed yet
+    module_class = registry.get("probe")
+    assert module_class.__name__ == "ProbeModule"
+    assert module_class.module_name == "probe"
+
+
+def test_mtime_change_rescans(tmp_path):
+    """Test that an edited module.py misses the cache and is executed again."""
+    modules_dir = tmp_path / "plugins"
+    module_file = _write_plugin(modules_dir, "probe", "ProbeModule")
+    ModuleRegistry().discover_modules(modules_dir, cache_dir=tmp_path / "cache")
+
+    _write_plugin(modules_dir, "probe", "RenamedModule")
+    stat = module_file.stat()
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    registry = ModuleRegistry()
+    registry.discover_modules(modules_dir, cache_dir=tmp_path / "cache")
+
+    assert registry._modules["probe"].__name__ == "RenamedModule"
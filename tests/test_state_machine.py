@@ -0,0 +1,95 @@
+"""Test navigation state machine transitions."""
+import logging
+
+import pytest
+
+from amiga_platform.core.state_machine import NavEvent, NavigationStateMachine, NavState
+
+
+def test_main_loop_sequence():
+    """Test the transition sequence driven by the main navigation loop."""
+    sm = NavigationStateMachine(strict=True)
+    sm.fire(NavEvent.START)
+    assert sm.current_state == NavState.PLANNING
+
+    # Vision path: approach, detect, refine, execute module
+    for event in (
+        NavEvent.GOAL_SET,
+        NavEvent.APPROACHING_STOP,
+        NavEvent.HOLE_DETECTED,
+        NavEvent.PATH_PLOTTED,
+        NavEvent.READY_FOR_MODULE,
+        NavEvent.MODULE_COMPLETE,
+    ):
+        sm.fire(event)
+    assert sm.current_state == NavState.UPDATING_PATTERN
+    assert sm.previous_state == NavState.MODULE_PHASE
+
+    # Next hole: CSV fallback, then approach failure and recovery
+    sm.fire(NavEvent.GOAL_SET)
+    sm.fire(NavEvent.APPROACHING_STOP)
+    sm.fire(NavEvent.HOLE_NOT_FOUND)
+    assert sm.current_state == NavState.PLOTTING_PATH
+    sm.fire(NavEvent.PATH_PLOTTED)
+    sm.fire(NavEvent.ENTER_RECOVERY)
+    assert sm.current_state == NavState.RECOVERING
+
+    sm.fire(NavEvent.MISSION_COMPLETE)
+    assert sm.is_terminal()
+
+
+def test_pattern_updated_decisions():
+    """Test the blast-pattern decision branches."""
+    sm = NavigationStateMachine(strict=True)
+    sm.transition(NavState.PLANNING)
+    sm.transition(NavState.PLOTTING_PATH)
+    sm.transition(NavState.FOLLOWING_PATH)
+    sm.transition(NavState.MODULE_PHASE)
+    sm.transition(NavState.UPDATING_PATTERN)
+
+    sm.pattern_updated(is_complete=False, is_echelon_end=True)
+    assert sm.current_state == NavState.ECHELON_TURN
+    sm.echelon_turn_complete()
+    assert sm.current_state == NavState.PLANNING
+
+
+def test_illegal_transition_rejected():
+    """Test that edges outside the allowed graph are logged and rejected."""
+    sm = NavigationStateMachine()
+    assert sm.transition(NavState.MODULE_PHASE) is False
+    assert sm.current_state == NavState.IDLE
+
+    # Abort is allowed from any state
+    sm.abort()
+    assert sm.current_state == NavState.FAILED
+
+
+def test_illegal_transition_raises_when_strict():
+    """Test that a strict machine raises on edges outside the allowed graph."""
+    sm = NavigationStateMachine(strict=True)
+    with pytest.raises(ValueError):
+        sm.transition(NavState.MODULE_PHASE)
+    assert sm.current_state == NavState.IDLE
+
+    assert sm.transition(NavState.PLANNING) is True
+    assert sm.current_state == NavState.PLANNING
+
+
+def test_illegal_event_rejected(caplog):
+    """Test that an event with no allowed edge is logged and leaves the state unchanged."""
+    sm = NavigationStateMachine()
+    sm.fire(NavEvent.START)
+
+    with caplog.at_level(logging.ERROR, logger="amiga_platform.core.state_machine"):
+        assert sm.fire(NavEvent.READY_FOR_MODULE) is False
+    assert sm.current_state == NavState.PLANNING
+    assert sm.previous_state == NavState.IDLE
+    assert "Rejected illegal transition planning → module_phase" in caplog.text
+
+
+def test_illegal_event_raises_when_strict():
+    """Test that a strict machine raises when fire() has no allowed edge."""
+    sm = NavigationStateMachine(strict=True)
+    with pytest.raises(ValueError):
+        sm.fire(NavEvent.MODULE_COMPLETE)
+    assert sm.current_state == NavState.IDLE
@@ -0,0 +1,105 @@
+"""Test the XStem stemming module's dipbob ACK handling."""
+import asyncio
+
+from farm_ng.canbus.canbus_pb2 import RawCanbusMessage, RawCanbusMessages
+
+from amiga_platform.hardware.filter_utils import DIPBOB_ARB_ID, eff_id
+from modules.base_module import ModuleContext, ModuleResult, execute_with_retry
+from modules.xstem.module import StemmingModule
+
+ACK_PAYLOAD = b"\x07\x00\x02\x00\x00\x00\x00\x00"
+
+# No physical chute and no settle waits, so a test hole takes milliseconds
+MODULE_CONFIG = {
+    "dipbob": {"ack_timeout_s": 0.2, "measurement_settle_s": 0.0},
+    "chute": {"actuator_id": -1, "pre_dispense_settle_s": 0.0},
+}
+
+
+class FakeCanbus:
+    """CAN bus client whose receive stream echoes each sent frame, then ACKs it."""
+
+    def __init__(self, ack: bool) -> None:
+        self.ack = ack
+        self.sent = []
+        self._rx: asyncio.Queue = asyncio.Queue()
+
+    async def request_reply(self, path, msg, decode=True):
+        self.sent.append(msg)
+        frames = [RawCanbusMessage(id=msg.id, data=msg.data)]  # Loopback echo
+        if self.ack:
+            frames.append(RawCanbusMessage(id=eff_id(DIPBOB_ARB_ID), data=ACK_PAYLOAD))
+        self._rx.put_nowait(RawCanbusMessages(messages=frames))
+
+    async def subscribe(self, request, decode=True):
+        while True:
+            yield None, await self._rx.get()
+
+
+def _context(canbus):
+    return ModuleContext(
+        hole_position=None,
+        robot_pose=None,
+        waypoint_index=0,
+        canbus_client=canbus,
+        filter_client=None,
+        vision_system=None,
+        module_config=MODULE_CONFIG,
+    )
+
+
+async def _with_module(ack: bool, action):
+    canbus = FakeCanbus(ack)
+    module = StemmingModule()
+    await module.initialize(_context(canbus))
+    try:
+        return await action(module), canbus
+    finally:
+        await module.shutdown()
+
+
+def test_wait_for_dipbob_ack_received():
+    """Test that the ACK frame from the CAN stream completes the wait."""
+    ack, canbus = asyncio.run(_with_module(True, lambda m: m._wait_for_dipbob_ack(timeout=1.0)))
+
+    assert ack is True
+    assert len(canbus.sent) == 1
+
+
+def test_wait_for_dipbob_ack_timeout():
+    """Test that only an echo of the trigger (no ACK) times out."""
+    ack, _ = asyncio.run(_with_module(False, lambda m: m._wait_for_dipbob_ack(timeout=0.05)))
+
+    assert ack is False
+
+
+def test_execute_succeeds_on_ack():
+    """Test the full sequence without vision when the dipbob ACKs."""
+    result, _ = asyncio.run(_with_module(True, lambda m: m.execute(_context(None))))
+
+    assert result is ModuleResult.OK
+
+
+def test_execute_timeout_is_transient():
+    """Test that a missing ACK fails the hole as a transient error."""
+    result, _ = asyncio.run(_with_module(False, lambda m: m.execute(_context(None))))
+
+    assert result.success is False
+    assert result.error_kind == "transient"
+
+
+def test_execute_error_during_dispense_is_permanent():
+    """Test that an exception while dispensing is never retried (no double fill)."""
+
+    async def _fail_dispense(module):
+        async def _broken_pulse(program):
+            raise OSError("CAN send failed")
+
+        module._pulse = _broken_pulse
+        return await execute_with_retry(module, _context(None), max_retries=3, backoff_s=0.0)
+
+    result, canbus = asyncio.run(_with_module(True, _fail_dispense))
+
+    assert result.success is False
+    assert result.error_kind == "permanent"
+    assert len(canbus.sent) == 1  # The dipbob was triggered once
@@ -1,67 +1,18 @@
-#!/usr/bin/env python3
-"""Simple YAML validation test for new configuration files."""
+"""Test that every shipped YAML configuration file parses."""
 from pathlib import Path
-import yaml
 
-def test_yaml_file(path: Path, name: str):
-    """Test loading a YAML file."""
-    print(f"\nTesting {name}:")
-    print(f"  Path: {path}")
+import pytest
 
-    if not path.exists():
-        print(f"  ✗ File does not exist")
-        return False
+from amiga_platform.core.config import _yaml_load
 
-    try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+ROOT = Path(__file__).resolve().parent.parent
+YAML_FILES = sorted(
+    [*ROOT.glob("config/**/*.yaml"), *ROOT.glob("modules/*/config.yaml")]
+)
 
-        print(f"  ✓ YAML syntax valid")
-        print(f"  ✓ Top-level keys: {list(data.keys())}")
-        return True
 
-    except Exception as e:
-        print(f"  ✗ Failed to load: {e}")
-        return False
-
-print("=" * 60)
-print("YAML Configuration File Validation")
-print("=" * 60)
-
-results = []
-
-# Test all new config files
-results.append(test_yaml_file(
-    Path("config/platform_config.yaml"),
-    "Platform Config"
-))
-
-results.append(test_yaml_file(
-    Path("config/mission_config.yaml"),
-    "Mission Config"
-))
-
-results.append(test_yaml_file(
-    Path("modules/xstem/config.yaml"),
-    "XStem Module Config"
-))
-
-results.append(test_yaml_file(
-    Path("config/examples/navigation_only.yaml"),
-    "Example: Navigation Only"
-))
-
-# Test old config for comparison
-results.append(test_yaml_file(
-    Path("config/navigation_config.yaml"),
-    "Legacy v1 Config (for comparison)"
-))
-
-print("\n" + "=" * 60)
-print(f"Results: {sum(results)}/{len(results)} files valid")
-print("=" * 60)
-
-if all(results[:4]):  # First 4 are critical
-    print("\n✓ All required configuration files are valid!")
-else:
-    print("\n✗ Some configuration files have errors")
+@pytest.mark.parametrize("path", YAML_FILES, ids=[str(p.relative_to(ROOT)) for p in YAML_FILES])
+def test_yaml_file(path):
+    """Test that a config file is valid YAML with a top-level mapping."""
+    data = _yaml_load(path.read_bytes())
+    assert isinstance(data, dict) and data